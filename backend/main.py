@@ -13,6 +13,7 @@ from fastapi.responses import FileResponse, JSONResponse
 from generate_pptx import create_pptx
 from generate_pptx import create_pptx
 from starlette.background import BackgroundTask
+from starlette.concurrency import run_in_threadpool
 import tempfile
 import imagehash
 from PIL import Image
@@ -226,7 +227,8 @@ async def generate_pptx(request: PPTXRequest):
         lang = (request.language or "en").lower()
         if lang not in ["en", "id"]:
             lang = "en"
-        create_pptx(transformed_content, temp_pptx_path, lang)
+        # Build off the event loop so other requests are served meanwhile
+        await run_in_threadpool(create_pptx, transformed_content, temp_pptx_path, lang)
         print(f"Temporary PPTX file created at: {temp_pptx_path}")
 
         if not os.path.exists(temp_pptx_path):
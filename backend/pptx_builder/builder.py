@@ -1,11 +1,14 @@
 import os
 import json
 import tempfile
+import threading
+import zipfile
 from pptx import Presentation
-from pptx.util import Inches
+from pptx.util import Inches, lazyproperty
 from .constants import SLIDE_WIDTH, SLIDE_HEIGHT
 from .localization import set_language, t
 from .slide_counter import calculate_total_slides
+from .slide_numbering import compute_slide_offsets
 from .sections import (
     create_title_slide,
     create_agenda_slide,
@@ -20,10 +23,80 @@ from .sections import (
     create_closing_slide,
 )
 
+try:
+    import orjson
+except ImportError:  # optional: faster parsing of large content files
+    orjson = None
+
+try:
+    from pptx.opc.serialized import PackageWriter, _ZipPkgWriter
+except ImportError:  # python-pptx internals moved; keep its default level
+    PackageWriter = _ZipPkgWriter = None
+
+# python-pptx deflates at zlib's default level 6. Slide XML compresses almost
+# as well at level 1, which saves noticeably faster for large decks.
+_SAVE_COMPRESSLEVEL = 1
+
+if PackageWriter is not None:
+
+    class _FastZipPkgWriter(_ZipPkgWriter):
+        @lazyproperty
+        def _zipf(self):
+            return zipfile.ZipFile(
+                self._pkg_file,
+                "w",
+                compression=zipfile.ZIP_DEFLATED,
+                compresslevel=_SAVE_COMPRESSLEVEL,
+                strict_timestamps=False,
+            )
+
+    class _FastPackageWriter(PackageWriter):
+        """``PackageWriter`` that writes through ``_FastZipPkgWriter``.
+
+        Only our own saves use it; python-pptx's writers stay untouched.
+        """
+
+        def _write(self):
+            with _FastZipPkgWriter(self._pkg_file) as phys_writer:
+                self._write_content_types_stream(phys_writer)
+                self._write_pkg_rels(phys_writer)
+                self._write_parts(phys_writer)
+
+
+def _save(prs, path):
+    if PackageWriter is None:
+        prs.save(path)
+        return
+    package = prs.part.package
+    _FastPackageWriter.write(path, package._rels, tuple(package.iter_parts()))
+
+
+_BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+_ALLOWED_OUTPUT = os.path.abspath(os.path.join(_BASE_DIR, "..", "output"))
+_TEMP_DIR = os.path.abspath(tempfile.gettempdir())
+
+
+def _is_within(path, directory):
+    try:
+        return os.path.commonpath([path, directory]) == directory
+    except ValueError:  # e.g. different drives on Windows
+        return False
+
+
+# The active language is module-global state, so builds must not overlap.
+# Saving happens outside the lock and can run alongside another build.
+_build_lock = threading.Lock()
+
 
 def build_full_presentation(content, language="en"):
+    with _build_lock:
+        return _build_full_presentation(content, language)
+
+
+def _build_full_presentation(content, language):
     set_language(language)
     total_slides = calculate_total_slides(content)
+    offsets = compute_slide_offsets(content)
     prs = Presentation()
     prs.slide_width = Inches(SLIDE_WIDTH)
     prs.slide_height = Inches(SLIDE_HEIGHT)
@@ -31,12 +104,14 @@ def build_full_presentation(content, language="en"):
     create_agenda_slide(prs, content, total_slides)
     create_learning_outcomes_slide(prs, content, total_slides)
     create_key_terms_slide(prs, content, total_slides)
-    create_content_slides(prs, content, total_slides)
+    create_content_slides(prs, content, total_slides, offsets)
     create_activity_slides(prs, content, total_slides)
-    create_quiz_slides(prs, content, total_slides)
-    create_discussion_slides(prs, content, total_slides)
-    create_further_readings_slides(prs, content, total_slides)
-    facilitation_slide = create_facilitation_notes_slide(prs, content, total_slides)
+    create_quiz_slides(prs, content, total_slides, offsets)
+    create_discussion_slides(prs, content, total_slides, offsets)
+    create_further_readings_slides(prs, content, total_slides, offsets)
+    facilitation_slide = create_facilitation_notes_slide(
+        prs, content, total_slides, offsets
+    )
     if facilitation_slide:
         total_slides += 1  # update for closing slide numbering if needed
     create_closing_slide(prs, content, total_slides, total_slides)
@@ -44,21 +119,23 @@ def build_full_presentation(content, language="en"):
 
 
 def create_pptx(content: dict, output_path: str, language: str = "en"):
-    base_dir = os.path.dirname(os.path.abspath(__file__))
     normalized_output_path = os.path.abspath(output_path)
-    allowed_output = os.path.abspath(os.path.join(base_dir, "..", "output"))
     parent = os.path.dirname(normalized_output_path)
-    is_temp = parent.startswith(os.path.abspath(tempfile.gettempdir()))
-    is_out = normalized_output_path.startswith(allowed_output)
+    is_temp = _is_within(parent, _TEMP_DIR)
+    is_out = _is_within(normalized_output_path, _ALLOWED_OUTPUT)
     if not (is_temp or is_out):
         raise ValueError(
             "Security violation: Output path must be in allowed directories"
         )
     prs = build_full_presentation(content, language)
-    prs.save(normalized_output_path)
+    _save(prs, normalized_output_path)
 
 
 def cli_build(content_path, output_path, language="en"):
-    with open(content_path, "r") as f:
-        content = json.load(f)
+    if orjson is not None:
+        with open(content_path, "rb") as f:
+            content = orjson.loads(f.read())
+    else:
+        with open(content_path, "r") as f:
+            content = json.load(f)
     create_pptx(content, output_path, language)
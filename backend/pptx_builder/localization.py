@@ -1,3 +1,4 @@
+from functools import lru_cache
 from . import constants
 
 
@@ -6,8 +7,19 @@ def set_language(lang: str):
     constants.GLOBAL_LANG = "id" if lang == "id" else "en"
 
 
-def t(key: str, **kwargs):
-    label = constants.LABELS.get(constants.GLOBAL_LANG, {}).get(key, key)
+def _translate(lang: str, key: str, kwargs: tuple):
+    label = constants.LABELS.get(lang, {}).get(key, key)
     if isinstance(label, dict):
         return label
-    return label.format(**kwargs) if kwargs else label
+    return label.format(**dict(kwargs)) if kwargs else label
+
+
+_translate_cached = lru_cache(maxsize=1024)(_translate)
+
+
+def t(key: str, **kwargs):
+    args = tuple(sorted(kwargs.items())) if kwargs else ()
+    try:
+        return _translate_cached(constants.GLOBAL_LANG, key, args)
+    except TypeError:  # unhashable format argument, skip the cache
+        return _translate(constants.GLOBAL_LANG, key, args)
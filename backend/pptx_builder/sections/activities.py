@@ -1,13 +1,26 @@
 import json
 from pptx.enum.shapes import MSO_SHAPE
 from pptx.enum.text import MSO_ANCHOR, PP_ALIGN
-from pptx.util import Inches, Pt
 from ..constants import COLORS, SLIDE_WIDTH, SLIDE_HEIGHT, FOOTER_Y, THEME
-from ..shapes import add_shape, add_text_box, add_footer
+from ..shapes import add_shape, add_text_box, add_footer, clone_shape, inches, pt
 from ..localization import t
 from ..utils import clean_activity_title, extract_facilitation_content
 
 
+def _style_runs(paragraph, size, color):
+    # A plain ``.text`` assignment yields a single run unless the text
+    # contains line breaks, so style that run directly in the common case.
+    runs = paragraph.runs
+    if len(runs) == 1:
+        font = runs[0].font
+        font.size = size
+        font.color.rgb = color
+        return
+    for run in runs:
+        run.font.size = size
+        run.font.color.rgb = color
+
+
 def create_activity_slides(prs, content, total_slides):
     activities = content.get("activities", [])
     if not activities:
@@ -17,9 +30,10 @@ def create_activity_slides(prs, content, total_slides):
         2
         + len(content.get("keyTerms", [])) // 4
         - 1
-        + len([s for i, s in enumerate(content.get("slides", [])) if i != 1])
+        + sum(1 for i, _ in enumerate(content.get("slides", [])) if i != 1)
         + 1
     )
+    presentation_title = content.get("title") or t("untitledPresentation")
     for act_idx, activity in enumerate(activities):
         original_title = activity.get("title", "") or t("untitledActivity")
         clean_title = clean_activity_title(original_title)
@@ -27,17 +41,17 @@ def create_activity_slides(prs, content, total_slides):
         slides.append(main_slide)
         materials_slide = prs.slides.add_slide(prs.slide_layouts[6])
         slides.append(materials_slide)
-        # Header bars
-        for slide in (main_slide, materials_slide):
-            add_shape(
-                slide,
-                MSO_SHAPE.RECTANGLE,
-                0,
-                0,
-                SLIDE_WIDTH,
-                0.8,
-                fill_color=COLORS["activity_blue"],
-            )
+        # Header bars (fill-only decorations are built once, then cloned)
+        header = add_shape(
+            main_slide,
+            MSO_SHAPE.RECTANGLE,
+            0,
+            0,
+            SLIDE_WIDTH,
+            0.8,
+            fill_color=COLORS["activity_blue"],
+        )
+        clone_shape(header, materials_slide)
         add_text_box(
             main_slide,
             t("activity", num=act_idx + 1, title=clean_title),
@@ -48,6 +62,7 @@ def create_activity_slides(prs, content, total_slides):
             font_size=22,
             bold=True,
             color=COLORS["text_light"],
+            auto_fit=True,
         )
         add_text_box(
             materials_slide,
@@ -59,18 +74,19 @@ def create_activity_slides(prs, content, total_slides):
             font_size=22,
             bold=True,
             color=COLORS["text_light"],
+            auto_fit=True,
         )
         # Badge
-        for slide in (main_slide, materials_slide):
-            add_shape(
-                slide,
-                MSO_SHAPE.ROUNDED_RECTANGLE,
-                0.5,
-                0.9,
-                5.0,
-                0.5,
-                fill_color=COLORS["activity_purple"],
-            )
+        badge = add_shape(
+            main_slide,
+            MSO_SHAPE.ROUNDED_RECTANGLE,
+            0.5,
+            0.9,
+            5.0,
+            0.5,
+            fill_color=COLORS["activity_purple"],
+        )
+        clone_shape(badge, materials_slide)
         activity_type = activity.get("type", "Exercise")
         activity_duration = activity.get("duration", "20 minutes")
         type_duration_text = (
@@ -90,18 +106,18 @@ def create_activity_slides(prs, content, total_slides):
                 vertical_alignment=MSO_ANCHOR.MIDDLE,
             )
         # Containers
-        for slide in (main_slide, materials_slide):
-            add_shape(
-                slide,
-                MSO_SHAPE.ROUNDED_RECTANGLE,
-                0.5,
-                1.5,
-                9.0,
-                3.5,
-                fill_color=COLORS["background"],
-                line_color=COLORS["activity_purple"],
-                line_width=1,
-            )
+        container = add_shape(
+            main_slide,
+            MSO_SHAPE.ROUNDED_RECTANGLE,
+            0.5,
+            1.5,
+            9.0,
+            3.5,
+            fill_color=COLORS["background"],
+            line_color=COLORS["activity_purple"],
+            line_width=1,
+        )
+        clone_shape(container, materials_slide)
         activity_description = activity.get("description", "")
         clean_description, facilitation_notes, learning_objectives = (
             extract_facilitation_content(activity_description)
@@ -116,6 +132,7 @@ def create_activity_slides(prs, content, total_slides):
                 0.6,
                 font_size=20,
                 color=COLORS["text"],
+                auto_fit=True,
             )
         if facilitation_notes or learning_objectives:
             combined = []
@@ -129,16 +146,17 @@ def create_activity_slides(prs, content, total_slides):
                     slide.notes_slide
                 slide.notes_slide.notes_text_frame.text = notes_text
         if facilitation_notes:
+            notes_badge = add_shape(
+                main_slide,
+                MSO_SHAPE.ROUNDED_RECTANGLE,
+                8.5,
+                0.9,
+                1.0,
+                0.5,
+                fill_color=COLORS["activity_green"],
+            )
+            clone_shape(notes_badge, materials_slide)
             for slide in (main_slide, materials_slide):
-                add_shape(
-                    slide,
-                    MSO_SHAPE.ROUNDED_RECTANGLE,
-                    8.5,
-                    0.9,
-                    1.0,
-                    0.5,
-                    fill_color=COLORS["activity_green"],
-                )
                 add_text_box(
                     slide,
                     t("notesAvailable"),
@@ -175,7 +193,7 @@ def create_activity_slides(prs, content, total_slides):
         )
         instructions = activity.get("instructions", [])
         instr_tb = main_slide.shapes.add_textbox(
-            Inches(0.9), Inches(instructions_y + 0.5), Inches(8.3), Inches(1.5)
+            inches(0.9), inches(instructions_y + 0.5), inches(8.3), inches(1.5)
         )
         frame = instr_tb.text_frame
         frame.word_wrap = True
@@ -185,9 +203,7 @@ def create_activity_slides(prs, content, total_slides):
                 instruction if isinstance(instruction, str) else json.dumps(instruction)
             )
             p.text = f"{idx + 1}. {text}"
-            for run in p.runs:
-                run.font.size = Pt(16)
-                run.font.color.rgb = COLORS["text"]
+            _style_runs(p, pt(16), COLORS["text"])
         # Materials
         materials_y = 2.4
         add_shape(
@@ -214,7 +230,7 @@ def create_activity_slides(prs, content, total_slides):
             "materials", ["Gaudi-3 optimization tools", "Neural network models"]
         )
         mat_tb = materials_slide.shapes.add_textbox(
-            Inches(0.9), Inches(materials_y + 0.5), Inches(8.3), Inches(1.5)
+            inches(0.9), inches(materials_y + 0.5), inches(8.3), inches(1.5)
         )
         mat_frame = mat_tb.text_frame
         mat_frame.word_wrap = True
@@ -222,30 +238,28 @@ def create_activity_slides(prs, content, total_slides):
             p = mat_frame.paragraphs[0] if idx == 0 else mat_frame.add_paragraph()
             text = material if isinstance(material, str) else json.dumps(material)
             p.text = f"• {text}"
-            for run in p.runs:
-                run.font.size = Pt(16)
-                run.font.color.rgb = COLORS["text"]
+            _style_runs(p, pt(16), COLORS["text"])
         # Bottom accent triangles
-        for slide in (main_slide, materials_slide):
-            add_shape(
-                slide,
-                MSO_SHAPE.RIGHT_TRIANGLE,
-                0,
-                SLIDE_HEIGHT - 1.5,
-                1.5,
-                1.5,
-                fill_color=COLORS["activity_orange"],
-            )
-            add_shape(
-                slide,
-                MSO_SHAPE.RECTANGLE,
-                0.5,
-                FOOTER_Y - 0.05,
-                9.0,
-                0.01,
-                fill_color=COLORS["primary_light"],
-            )
-        presentation_title = content.get("title") or t("untitledPresentation")
+        triangle = add_shape(
+            main_slide,
+            MSO_SHAPE.RIGHT_TRIANGLE,
+            0,
+            SLIDE_HEIGHT - 1.5,
+            1.5,
+            1.5,
+            fill_color=COLORS["activity_orange"],
+        )
+        separator = add_shape(
+            main_slide,
+            MSO_SHAPE.RECTANGLE,
+            0.5,
+            FOOTER_Y - 0.05,
+            9.0,
+            0.01,
+            fill_color=COLORS["primary_light"],
+        )
+        clone_shape(triangle, materials_slide)
+        clone_shape(separator, materials_slide)
         main_num = slide_count_offset + (act_idx * 2) + 1
         materials_num = slide_count_offset + (act_idx * 2) + 2
         add_text_box(
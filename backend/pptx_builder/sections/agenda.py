@@ -1,12 +1,80 @@
-import math
-from pptx.enum.shapes import MSO_SHAPE
-from pptx.util import Inches, Pt
+from bisect import bisect_right
+from itertools import accumulate
 from pptx.enum.text import PP_ALIGN
-from ..constants import COLORS, SLIDE_WIDTH, FOOTER_Y, THEME
-from ..shapes import add_shape, add_text_box, add_footer
+from ..constants import COLORS, FOOTER_Y, THEME
+from ..shapes import (
+    ShapeBatch,
+    add_footer,
+    add_plain_textbox,
+    add_standard_header,
+    inches,
+    pt,
+)
 from ..localization import t
 from ..utils import clean_slide_title
 
+_FOOTER_STYLE = THEME["footer_style"]
+
+# Agenda rows are 0.5in per section title and 0.35in per item, laid out
+# from _LIST_Y down to _MAX_Y. Exact line spacing reproduces those rows in
+# a single text box. Page counts and page splits both work in whole
+# hundredths of an inch (the _UNITS constants) so they agree exactly.
+_SECTION_HEIGHT = 0.5
+_ITEM_HEIGHT = 0.35
+_LIST_Y = 1.1
+_MAX_Y = FOOTER_Y - 0.3
+_LIST_LEFT = inches(0.7)
+_LIST_TOP = inches(_LIST_Y)
+_LIST_WIDTH = inches(8.5)
+_LIST_HEIGHT = inches(_MAX_Y - _LIST_Y)
+_SECTION_UNITS = round(_SECTION_HEIGHT * 100)
+_ITEM_UNITS = round(_ITEM_HEIGHT * 100)
+_PAGE_UNITS = round((_MAX_Y - _LIST_Y) * 100)
+_AVAILABLE_UNITS = round((FOOTER_Y - 1.2) * 100)
+_ITEM_INDENT = str(inches(0.3))
+_SECTION_SPACING = pt(_SECTION_HEIGHT * 72)
+_ITEM_SPACING = pt(_ITEM_HEIGHT * 72)
+_PT24 = pt(24)
+_PT18 = pt(18)
+
+
+def _next_paragraph(tf, p):
+    return tf.paragraphs[0] if p is None else tf.add_paragraph()
+
+
+def _agenda_rows(agenda_items):
+    """Flatten the agenda into ``(section_idx, item_idx)`` rows.
+
+    ``item_idx`` is None for a section title.
+    """
+    rows = []
+    for section_idx, section in enumerate(agenda_items):
+        rows.append((section_idx, None))
+        rows.extend((section_idx, i) for i in range(len(section["items"])))
+    return rows
+
+
+def _paginate(rows, slides_needed):
+    """Split agenda rows into the rows shown on each slide.
+
+    A section continued from the previous slide repeats its title; rows that
+    do not fit on the last slide are dropped.
+    """
+    pages = []
+    start = 0
+    for _ in range(slides_needed):
+        page = rows[start:]
+        continued = bool(page) and page[0][1] is not None
+        if continued:
+            page.insert(0, (page[0][0], None))
+        units = (
+            _SECTION_UNITS if item_idx is None else _ITEM_UNITS for _, item_idx in page
+        )
+        fit = bisect_right(list(accumulate(units, initial=0)), _PAGE_UNITS) - 1
+        pages.append(page[:fit])
+        start += max(fit - continued, 0)
+    return pages
+
 
 def create_agenda_slide(prs, content, total_slides):
     agenda_items = []
@@ -27,14 +95,11 @@ def create_agenda_slide(prs, content, total_slides):
     discussion_count = 0
     for idea in content.get("assessmentIdeas", []):
         idea_type = idea.get("type", "").lower()
+        questions = idea.get("exampleQuestions") or []
         if "quiz" in idea_type:
-            quiz_count += len(
-                [q for q in idea.get("exampleQuestions", []) if q.get("options")]
-            )
+            quiz_count += sum(1 for q in questions if q.get("options"))
         elif "discussion" in idea_type:
-            discussion_count += len(
-                idea.get("exampleQuestions", []) if idea.get("exampleQuestions") else []
-            )
+            discussion_count += len(questions)
     if quiz_count > 0:
         knowledge_items.append(t("quizQuestions", count=quiz_count))
     if discussion_count > 0:
@@ -45,106 +110,71 @@ def create_agenda_slide(prs, content, total_slides):
         agenda_items.append(
             {"title": t("additionalResources"), "items": [t("furtherReadings")]}
         )
-    section_height = 0.5
-    item_height = 0.35
-    total_height_needed = 0
-    for section in agenda_items:
-        total_height_needed += section_height + len(section["items"]) * item_height
-    available_height = FOOTER_Y - 1.2
-    slides_needed = math.ceil(total_height_needed / available_height)
+    # Count in whole hundredths of an inch so an exact fit never rounds up
+    total_units = _SECTION_UNITS * len(agenda_items) + _ITEM_UNITS * sum(
+        len(section["items"]) for section in agenda_items
+    )
+    slides_needed = -(-total_units // _AVAILABLE_UNITS)
+    presentation_title = content.get("title") or t("untitledPresentation")
+    blank_layout = prs.slide_layouts[6]
+    light = COLORS["light"]
+    primary = COLORS["primary"]
+    primary_light = COLORS["primary_light"]
+    text_color = COLORS["text"]
     agenda_slides = []
-    section_start_idx = 0
-    item_start_idx = 0
-    consumed = []  # track per slide
-    for slide_idx in range(slides_needed):
-        slide = prs.slides.add_slide(prs.slide_layouts[6])
+    rows = _agenda_rows(agenda_items)
+    if total_units <= _PAGE_UNITS:
+        pages = [rows]  # the common case: everything fits on one slide
+    else:
+        pages = _paginate(rows, slides_needed)
+    for slide_idx, page in enumerate(pages):
+        slide = prs.slides.add_slide(blank_layout)
+        slide.shapes.turbo_add_enabled = True
         agenda_slides.append(slide)
-        add_shape(
-            slide,
-            MSO_SHAPE.RECTANGLE,
-            0,
-            0,
-            SLIDE_WIDTH,
-            0.8,
-            fill_color=COLORS["primary"],
-        )
-        title = t("agenda")
-        if slide_idx > 0:
-            title += t("agendaContinued", idx=slide_idx + 1, total=slides_needed)
-        add_text_box(
-            slide,
-            title,
-            0.5,
-            0.1,
-            9,
-            0.6,
-            font_size=36,
-            bold=True,
-            color=COLORS["text_light"],
-        )
-        add_shape(
-            slide,
-            MSO_SHAPE.ROUNDED_RECTANGLE,
-            0.3,
-            0.9,
-            9.4,
-            FOOTER_Y - 1.1,
-            fill_color=COLORS["light"],
-            opacity=0.9,
-            line_color=COLORS["primary_light"],
-            line_width=1,
-        )
-        y = 1.1
-        max_y = FOOTER_Y - 0.3
-        current_section_idx = section_start_idx
-        current_item_start = item_start_idx
-        while current_section_idx < len(agenda_items) and y < max_y:
-            section = agenda_items[current_section_idx]
-            if y + section_height > max_y:
-                break
-            add_text_box(
+        with ShapeBatch(slide):
+            title = t("agenda")
+            if slide_idx > 0:
+                title += t("agendaContinued", idx=slide_idx + 1, total=slides_needed)
+            add_standard_header(
                 slide,
-                section["title"],
-                0.7,
-                y,
-                8.5,
-                section_height,
-                font_size=24,
-                bold=True,
-                color=COLORS["primary"],
+                title,
+                font_size=36,
+                card=(0.3, 0.9, 9.4, FOOTER_Y - 1.1),
+                fill_color=light,
+                opacity=0.9,
+                line_color=primary_light,
+                line_width=1,
             )
-            y += section_height
-            items = section["items"][current_item_start:]
-            for idx, item in enumerate(items):
-                if y + item_height > max_y:
-                    item_start_idx = current_item_start + idx
-                    break
-                tb = slide.shapes.add_textbox(
-                    Inches(1.0), Inches(y), Inches(8.0), Inches(item_height)
-                )
-                p = tb.text_frame.paragraphs[0]
-                p.level = 1
-                try:
-                    p.bullet.visible = True
-                except:
-                    item = f"• {item}"
+            tb = add_plain_textbox(
+                slide, _LIST_LEFT, _LIST_TOP, _LIST_WIDTH, _LIST_HEIGHT
+            )
+            # Rows never wrap (the textbox keeps wrap="none"), so each one
+            # stays a single line and pagination can count rows
+            tf = tb.text_frame
+            p = None
+            for section_idx, item_idx in page:
+                section = agenda_items[section_idx]
+                p = _next_paragraph(tf, p)
                 run = p.add_run()
-                run.text = item
-                run.font.size = Pt(18)
-                run.font.color.rgb = COLORS["text"]
-                y += item_height
-            else:
-                current_section_idx += 1
-                current_item_start = 0
-                item_start_idx = 0
-                section_start_idx = current_section_idx
-                continue
-            break
-        add_footer(
-            slide,
-            (content.get("title") or t("untitledPresentation")),
-            slide_idx + 2,
-            total_slides,
-            THEME["footer_style"],
-        )
+                if item_idx is None:
+                    p.line_spacing = _SECTION_SPACING
+                    run.text = section["title"]
+                    run.font.size = _PT24
+                    run.font.bold = True
+                    run.font.color.rgb = primary
+                    continue
+                item = section["items"][item_idx]
+                p.level = 1
+                p._pPr.set("marL", _ITEM_INDENT)
+                p.line_spacing = _ITEM_SPACING
+                run.text = f"• {item}"
+                run.font.size = _PT18
+                run.font.color.rgb = text_color
+            add_footer(
+                slide,
+                presentation_title,
+                slide_idx + 2,
+                total_slides,
+                _FOOTER_STYLE,
+            )
     return agenda_slides
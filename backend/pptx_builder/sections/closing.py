@@ -10,10 +10,16 @@ from ..shapes import (
 )
 from ..localization import t
 
+# The theme is fixed for the process, so read its flags once at import
+_USE_GRADIENTS = THEME["use_gradients"]
+_CORNER_ACCENT = THEME["corner_accent"]
+_FOOTER_STYLE = THEME["footer_style"]
+
 
 def create_closing_slide(prs, content, total_slides, slide_number):
     slide = prs.slides.add_slide(prs.slide_layouts[6])
-    if THEME["use_gradients"]:
+    slide.shapes.turbo_add_enabled = True
+    if _USE_GRADIENTS:
         add_gradient_background(
             prs, slide, COLORS["gradient_start"], COLORS["gradient_end"], angle=135
         )
@@ -27,7 +33,7 @@ def create_closing_slide(prs, content, total_slides, slide_number):
             SLIDE_HEIGHT,
             fill_color=COLORS["primary_dark"],
         )
-    if THEME["corner_accent"]:
+    if _CORNER_ACCENT:
         add_corner_accent(slide, COLORS["accent1"], 2.0, "top-right")
         add_corner_accent(slide, COLORS["accent2"], 1.5, "bottom-left")
     title = t("thankYou")
@@ -61,12 +67,13 @@ def create_closing_slide(prs, content, total_slides, slide_number):
         italic=True,
         color=COLORS["text_light"],
         alignment=PP_ALIGN.CENTER,
+        auto_fit=True,
     )
     add_footer(
         slide,
-        (content.get("title") or t("untitledPresentation")),
+        presentation_title,
         slide_number,
         total_slides,
-        THEME["footer_style"],
+        _FOOTER_STYLE,
     )
     return slide
@@ -1,4 +1,3 @@
-import json
 from pptx.enum.shapes import MSO_SHAPE
 from ..constants import (
     COLORS,
@@ -9,148 +8,154 @@ from ..constants import (
     MAIN_BULLET_INDENT,
 )
 from ..shapes import (
+    ShapeBatch,
     add_gradient_background,
     add_shape,
     add_corner_accent,
     add_text_box,
     add_footer,
+    add_plain_textbox,
+    add_standard_header,
+    inches,
+    pt,
 )
 from ..localization import t
-from ..utils import clean_slide_title
-from pptx.util import Inches, Pt
+from ..utils import as_text, clean_slide_title
+from ..slide_numbering import compute_slide_offsets
 
+# The theme is fixed for the process, so read its flags once at import
+_USE_GRADIENTS = THEME["use_gradients"]
+_CORNER_ACCENT = THEME["corner_accent"]
+_CONTENT_SHADOW = THEME["content_box_shadow"]
+_MODERN_BULLETS = THEME["modern_bullets"]
+_FOOTER_STYLE = THEME["footer_style"]
 
-def create_content_slides(prs, content, total_slides):
+# Body text box geometry and font sizes, converted once at import
+_MAIN_BULLET_LEFT = inches(MAIN_BULLET_INDENT)
+_BODY_TOP = inches(CONTENT_START_Y)
+_BODY_WIDTH = inches(9 - MAIN_BULLET_INDENT)
+_BODY_HEIGHT = inches(FOOTER_Y - CONTENT_START_Y - 0.3)
+_PT18 = pt(18)
+_PT16 = pt(16)
+
+
+def _parse_point(point):
+    """Split a content point into ``(text, is_bullet, level, is_str)``.
+
+    ``is_bullet`` is None for plain lines, which become bullets only when the
+    slide has no sub-points. ``is_str`` is False for points serialized from
+    JSON values, which never count as sub-points.
+    """
+    is_str = isinstance(point, str)
+    text = as_text(point)
+    stripped = text.strip()
+    if stripped.startswith(("•", "*")):
+        return stripped[1:].strip(), True, 0, is_str
+    if stripped.startswith("-"):
+        return stripped[1:].strip(), True, 1, is_str
+    if stripped.startswith(("  ", "\\t")):
+        return stripped, True, 1, is_str
+    return text, None, 0, is_str
+
+
+def _classify_points(points):
+    """Resolve a slide's points into ``(level, font_size, bold, text)`` rows."""
+    parsed = [_parse_point(point) for point in points]
+    has_sub = any(level and is_str for _, _, level, is_str in parsed)
+    rows = []
+    for text, is_bullet, level, _ in parsed:
+        if is_bullet is None:
+            is_bullet = not has_sub
+        if is_bullet and _MODERN_BULLETS:
+            text = ("◦ " if level > 0 else "• ") + text
+        size = _PT18 if level == 0 else _PT16
+        rows.append((level, size, not is_bullet and level == 0, text))
+    return rows
+
+
+def create_content_slides(prs, content, total_slides, offsets=None):
     slides_data = content.get("slides", [])
     if not slides_data:
         return []
     result = []
-    slide_count_offset = 2 + len(content.get("keyTerms", [])) // 4
+    presentation_title = content.get("title") or t("untitledPresentation")
+    blank_layout = prs.slide_layouts[6]
+    background = COLORS["background"]
+    light_alt = COLORS["light_alt"]
+    primary = COLORS["primary"]
+    primary_dark = COLORS["primary_dark"]
+    primary_light = COLORS["primary_light"]
+    royal_blue = COLORS["royal_blue"]
+    text_color = COLORS["text"]
+    accent_colors = (COLORS["accent1"], COLORS["accent2"], COLORS["accent3"])
+    offsets = offsets or compute_slide_offsets(content)
+    slide_count_offset = offsets.content_offset
     for slide_idx, slide_content in enumerate(slides_data):
         if slide_idx == 1:  # skip second slide as per original logic
             continue
-        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        slide = prs.slides.add_slide(blank_layout)
+        slide.shapes.turbo_add_enabled = True
         result.append(slide)
-        if THEME["use_gradients"]:
-            add_gradient_background(
-                prs, slide, COLORS["primary"], COLORS["primary_dark"], angle=0
-            )
-            add_shape(
-                slide,
-                MSO_SHAPE.RECTANGLE,
-                0,
-                0.8,
-                SLIDE_WIDTH,
-                (5.625 - 0.8),
-                fill_color=COLORS["background"],
-                opacity=0.9,
-            )
-        else:
-            add_shape(
+        with ShapeBatch(slide):
+            if _USE_GRADIENTS:
+                add_gradient_background(prs, slide, primary, primary_dark, angle=0)
+                add_shape(
+                    slide,
+                    MSO_SHAPE.RECTANGLE,
+                    0,
+                    0.8,
+                    SLIDE_WIDTH,
+                    (5.625 - 0.8),
+                    fill_color=background,
+                    opacity=0.9,
+                )
+            if _CORNER_ACCENT:
+                accent_color = accent_colors[slide_idx % 3]
+                add_corner_accent(slide, accent_color, 1.0, "bottom-right")
+            cleaned_title = clean_slide_title(slide_content.get("title", ""))
+            card = None
+            if _CONTENT_SHADOW:
+                content_height = FOOTER_Y - CONTENT_START_Y - 0.2
+                card = (0.3, CONTENT_START_Y - 0.1, 9.4, content_height)
+            # With gradients the background already provides the header band
+            add_standard_header(
                 slide,
-                MSO_SHAPE.RECTANGLE,
-                0,
-                0,
-                SLIDE_WIDTH,
-                0.8,
-                fill_color=COLORS["royal_blue"],
-            )
-        if THEME["corner_accent"]:
-            accent_color = [COLORS["accent1"], COLORS["accent2"], COLORS["accent3"]][
-                slide_idx % 3
-            ]
-            add_corner_accent(slide, accent_color, 1.0, "bottom-right")
-        cleaned_title = clean_slide_title(slide_content.get("title", ""))
-        add_text_box(
-            slide,
-            cleaned_title,
-            0.5,
-            0.1,
-            9,
-            0.6,
-            font_size=32,
-            bold=True,
-            color=COLORS["text_light"],
-        )
-        points = slide_content.get("content", [])
-        if THEME["content_box_shadow"]:
-            content_height = FOOTER_Y - CONTENT_START_Y - 0.2
-            add_shape(
-                slide,
-                MSO_SHAPE.ROUNDED_RECTANGLE,
-                0.3,
-                CONTENT_START_Y - 0.1,
-                9.4,
-                content_height,
-                fill_color=COLORS["light_alt"],
+                cleaned_title,
+                bar_color=None if _USE_GRADIENTS else royal_blue,
+                card=card,
+                fill_color=light_alt,
                 opacity=0.7,
-                line_color=COLORS["primary_light"],
+                line_color=primary_light,
                 line_width=1,
                 shadow=True,
             )
-        tb = slide.shapes.add_textbox(
-            Inches(MAIN_BULLET_INDENT),
-            Inches(CONTENT_START_Y),
-            Inches(9 - MAIN_BULLET_INDENT),
-            Inches(FOOTER_Y - CONTENT_START_Y - 0.3),
-        )
-        tf = tb.text_frame
-        tf.word_wrap = True
-        has_sub = any(
-            p.strip().startswith(("  ", "\\t", "-"))
-            for p in points
-            if isinstance(p, str)
-        )
-        p = tf.paragraphs[0]
-        first = True
-        for point in points:
-            text = point if isinstance(point, str) else json.dumps(point)
-            is_bullet = False
-            level = 0
-            if text.strip().startswith(("•", "*")):
-                is_bullet = True
-                text = text.strip()[1:].strip()
-            elif text.strip().startswith("-"):
-                is_bullet = True
-                level = 1
-                text = text.strip()[1:].strip()
-            elif text.strip().startswith("  ") or text.strip().startswith("\\t"):
-                is_bullet = True
-                level = 1
-                text = text.strip()
-            elif not has_sub:
-                is_bullet = True
-            if not first:
-                p = tf.add_paragraph()
-            else:
-                first = False
-            if is_bullet:
+            points = slide_content.get("content", [])
+            tb = add_plain_textbox(
+                slide, _MAIN_BULLET_LEFT, _BODY_TOP, _BODY_WIDTH, _BODY_HEIGHT
+            )
+            tf = tb.text_frame
+            tf.word_wrap = True
+            for idx, (level, size, bold, text) in enumerate(_classify_points(points)):
+                p = tf.paragraphs[0] if idx == 0 else tf.add_paragraph()
                 p.level = level
-                try:
-                    p.bullet.visible = True
-                except:
-                    if THEME["modern_bullets"]:
-                        text = ("◦ " if level > 0 else "• ") + text
-            run = p.add_run()
-            run.text = text
-            font = run.font
-            font.size = Pt(18) if level == 0 else Pt(16)
-            font.bold = not is_bullet and level == 0
-            font.color.rgb = COLORS["text"]
-        notes = slide_content.get("notes", "")
-        if notes:
-            if not slide.has_notes_slide:
-                slide.notes_slide
-            slide.notes_slide.notes_text_frame.text = (
-                notes if isinstance(notes, str) else json.dumps(notes)
+                run = p.add_run()
+                run.text = text
+                font = run.font
+                font.size = size
+                font.bold = bold
+                font.color.rgb = text_color
+            notes = slide_content.get("notes", "")
+            if notes:
+                if not slide.has_notes_slide:
+                    slide.notes_slide
+                slide.notes_slide.notes_text_frame.text = as_text(notes)
+            adjusted_idx = slide_idx if slide_idx < 1 else slide_idx - 1
+            slide_number = slide_count_offset + adjusted_idx + 1
+            add_footer(
+                slide,
+                presentation_title,
+                slide_number,
+                total_slides,
+                _FOOTER_STYLE,
             )
-        adjusted_idx = slide_idx if slide_idx < 1 else slide_idx - 1
-        slide_number = slide_count_offset + adjusted_idx + 1
-        add_footer(
-            slide,
-            (content.get("title") or t("untitledPresentation")),
-            slide_number,
-            total_slides,
-            THEME["footer_style"],
-        )
     return result
@@ -1,216 +1,188 @@
-import json
 from pptx.enum.shapes import MSO_SHAPE
-from ..constants import COLORS, SLIDE_WIDTH, FOOTER_Y, THEME
-from ..shapes import add_shape, add_text_box, add_footer
+from ..constants import COLORS, FOOTER_Y, THEME
+from ..shapes import (
+    ShapeBatch,
+    add_shape,
+    add_text_box,
+    add_footer,
+    add_standard_header,
+    clone_shape,
+)
 from ..localization import t
-from ..utils import estimate_text_height
+from ..utils import as_text, estimate_text_heights
+from ..slide_numbering import compute_slide_offsets
 
+_FOOTER_STYLE = THEME["footer_style"]
 
-def create_discussion_slides(prs, content, total_slides):
+
+def _copy_header(header, slide, title):
+    """Clone a header built by ``add_standard_header`` and retitle it."""
+    _, title_box, _ = (clone_shape(shape, slide) for shape in header)
+    title_box.text_frame.paragraphs[0].runs[0].text = title
+
+
+def create_discussion_slides(prs, content, total_slides, offsets=None):
     assessment_ideas = content.get("assessmentIdeas", [])
     slides = []
-    slide_count_offset = (
-        2
-        + len(content.get("keyTerms", [])) // 4
-        - 1
-        + len([s for i, s in enumerate(content.get("slides", [])) if i != 1])
-        + len(content.get("activities", [])) * 2
-        + 1
-    )
-    quiz_count = 0
-    for idea in content.get("assessmentIdeas", []):
-        if "quiz" in idea.get("type", "").lower():
-            quiz_count += (
-                len([q for q in idea.get("exampleQuestions", []) if q.get("options")])
-                * 2
-            )
+    blank_layout = prs.slide_layouts[6]
+    accent2 = COLORS["accent2"]
+    light = COLORS["light"]
+    primary = COLORS["primary"]
+    text_color = COLORS["text"]
+    presentation_title = content.get("title") or t("untitledPresentation")
+    offsets = offsets or compute_slide_offsets(content)
+    slide_count_offset = offsets.base_offset
+    quiz_count = offsets.quiz_count * 2
     discussion_slide_count = 0
+    # Every question and guidance slide shares the same header; build it once
+    # and clone it onto the rest.
+    header = None
     for idea in assessment_ideas:
         if "discussion" not in idea.get("type", "").lower():
             continue
-        for q_idx, question in enumerate(idea.get("exampleQuestions", [])):
-            question_text = question.get("question", "Example question")
+        questions = idea.get("exampleQuestions", [])
+        question_texts = [q.get("question", "Example question") for q in questions]
+        question_heights = estimate_text_heights(question_texts, 20, 8.6)
+        for q_idx, question in enumerate(questions):
+            question_text = question_texts[q_idx]
+            question_text_height = question_heights[q_idx]
             guidance = question.get("correctAnswer", "")
-            q_slide = prs.slides.add_slide(prs.slide_layouts[6])
+            q_slide = prs.slides.add_slide(blank_layout)
+            q_slide.shapes.turbo_add_enabled = True
             slides.append(q_slide)
-            discussion_slide_count += 1
-            add_shape(
-                q_slide,
-                MSO_SHAPE.RECTANGLE,
-                0,
-                0,
-                SLIDE_WIDTH,
-                0.8,
-                fill_color=COLORS["primary"],
-            )
-            add_text_box(
-                q_slide,
-                t("discussionQuestion", num=q_idx + 1),
-                0.5,
-                0.1,
-                9.0,
-                0.6,
-                font_size=32,
-                bold=True,
-                color=COLORS["text_light"],
-            )
-            add_shape(
-                q_slide,
-                MSO_SHAPE.ROUNDED_RECTANGLE,
-                0.5,
-                1.1,
-                9.0,
-                0.8,
-                fill_color=COLORS["light"],
-                line_color=COLORS["light"],
-                line_width=1,
-            )
-            add_text_box(
-                q_slide,
-                question_text,
-                0.7,
-                1.2,
-                8.6,
-                0.6,
-                font_size=20,
-                bold=True,
-                color=COLORS["text"],
-            )
-            question_text_height = estimate_text_height(question_text, 20, 8.6)
-            next_y = 1.2 + question_text_height + 1.2
-            add_shape(
-                q_slide,
-                MSO_SHAPE.RECTANGLE,
-                0.7,
-                next_y,
-                0.1,
-                0.4,
-                fill_color=COLORS["primary"],
-            )
-            add_text_box(
-                q_slide,
-                t("groupDiscussion"),
-                0.9,
-                next_y,
-                8.5,
-                0.4,
-                font_size=20,
-                bold=True,
-                color=COLORS["primary"],
-            )
-            add_text_box(
-                q_slide,
-                t("groupInstruction"),
-                0.9,
-                next_y + 0.5,
-                8.5,
-                0.4,
-                font_size=18,
-                color=COLORS["text"],
-            )
-            presentation_title = content.get("title") or t("untitledPresentation")
-            slide_number = slide_count_offset + quiz_count + discussion_slide_count
-            add_footer(
-                q_slide,
-                presentation_title,
-                slide_number,
-                total_slides,
-                THEME["footer_style"],
-            )
-            a_slide = prs.slides.add_slide(prs.slide_layouts[6])
-            slides.append(a_slide)
-            discussion_slide_count += 1
-            add_shape(
-                a_slide,
-                MSO_SHAPE.RECTANGLE,
-                0,
-                0,
-                SLIDE_WIDTH,
-                0.8,
-                fill_color=COLORS["primary"],
-            )
-            add_text_box(
-                a_slide,
-                t("facilitatorGuidance", num=q_idx + 1),
-                0.5,
-                0.1,
-                9.0,
-                0.6,
-                font_size=32,
-                bold=True,
-                color=COLORS["text_light"],
-            )
-            add_shape(
-                a_slide,
-                MSO_SHAPE.ROUNDED_RECTANGLE,
-                0.5,
-                1.1,
-                9.0,
-                0.8,
-                fill_color=COLORS["light"],
-                line_color=COLORS["light"],
-                line_width=1,
-            )
-            add_text_box(
-                a_slide,
-                f"{t('question', text=question_text)}",
-                0.7,
-                1.2,
-                8.6,
-                0.6,
-                font_size=18,
-                italic=True,
-                color=COLORS["text"],
-            )
-            guidance_y = 1.2 + question_text_height + 0.7
-            if guidance:
-                add_shape(
-                    a_slide,
-                    MSO_SHAPE.ROUNDED_RECTANGLE,
-                    0.5,
-                    guidance_y,
-                    9.0,
-                    2.8,
-                    fill_color=COLORS["light"],
-                    line_color=COLORS["accent2"],
-                    line_width=2,
+            with ShapeBatch(q_slide):
+                discussion_slide_count += 1
+                q_title = t("discussionQuestion", num=q_idx + 1)
+                if header is None:
+                    header = add_standard_header(
+                        q_slide,
+                        q_title,
+                        card=(0.5, 1.1, 9.0, 0.8),
+                        fill_color=light,
+                        line_color=light,
+                        line_width=1,
+                    )
+                else:
+                    _copy_header(header, q_slide, q_title)
+                add_text_box(
+                    q_slide,
+                    question_text,
+                    0.7,
+                    1.2,
+                    8.6,
+                    0.6,
+                    font_size=20,
+                    bold=True,
+                    color=text_color,
+                    auto_fit=True,
                 )
+                next_y = 1.2 + question_text_height + 1.2
                 add_shape(
-                    a_slide,
+                    q_slide,
                     MSO_SHAPE.RECTANGLE,
                     0.7,
-                    guidance_y + 0.1,
+                    next_y,
                     0.1,
-                    2.5,
-                    fill_color=COLORS["accent2"],
+                    0.4,
+                    fill_color=primary,
                 )
                 add_text_box(
-                    a_slide,
-                    t("facilitatorGuidance", num=q_idx + 1).split(":")[0] + ":",
+                    q_slide,
+                    t("groupDiscussion"),
                     0.9,
-                    guidance_y + 0.1,
+                    next_y,
                     8.5,
                     0.4,
                     font_size=20,
                     bold=True,
-                    color=COLORS["accent2"],
+                    color=primary,
                 )
                 add_text_box(
-                    a_slide,
-                    guidance if isinstance(guidance, str) else json.dumps(guidance),
+                    q_slide,
+                    t("groupInstruction"),
                     0.9,
-                    guidance_y + 0.6,
-                    8.3,
-                    1.5,
-                    font_size=16,
-                    color=COLORS["text"],
+                    next_y + 0.5,
+                    8.5,
+                    0.4,
+                    font_size=18,
+                    color=text_color,
+                )
+                slide_number = slide_count_offset + quiz_count + discussion_slide_count
+                add_footer(
+                    q_slide,
+                    presentation_title,
+                    slide_number,
+                    total_slides,
+                    _FOOTER_STYLE,
+                )
+            a_slide = prs.slides.add_slide(blank_layout)
+            a_slide.shapes.turbo_add_enabled = True
+            slides.append(a_slide)
+            with ShapeBatch(a_slide):
+                discussion_slide_count += 1
+                _copy_header(header, a_slide, t("facilitatorGuidance", num=q_idx + 1))
+                add_text_box(
+                    a_slide,
+                    f"{t('question', text=question_text)}",
+                    0.7,
+                    1.2,
+                    8.6,
+                    0.6,
+                    font_size=18,
+                    italic=True,
+                    color=text_color,
+                    auto_fit=True,
+                )
+                guidance_y = 1.2 + question_text_height + 0.7
+                if guidance:
+                    add_shape(
+                        a_slide,
+                        MSO_SHAPE.ROUNDED_RECTANGLE,
+                        0.5,
+                        guidance_y,
+                        9.0,
+                        2.8,
+                        fill_color=light,
+                        line_color=accent2,
+                        line_width=2,
+                    )
+                    add_shape(
+                        a_slide,
+                        MSO_SHAPE.RECTANGLE,
+                        0.7,
+                        guidance_y + 0.1,
+                        0.1,
+                        2.5,
+                        fill_color=accent2,
+                    )
+                    add_text_box(
+                        a_slide,
+                        t("facilitatorGuidance", num=q_idx + 1).split(":")[0] + ":",
+                        0.9,
+                        guidance_y + 0.1,
+                        8.5,
+                        0.4,
+                        font_size=20,
+                        bold=True,
+                        color=accent2,
+                    )
+                    add_text_box(
+                        a_slide,
+                        as_text(guidance),
+                        0.9,
+                        guidance_y + 0.6,
+                        8.3,
+                        1.5,
+                        font_size=16,
+                        color=text_color,
+                        auto_fit=True,
+                    )
+                slide_number = slide_count_offset + quiz_count + discussion_slide_count
+                add_footer(
+                    a_slide,
+                    presentation_title,
+                    slide_number,
+                    total_slides,
+                    _FOOTER_STYLE,
                 )
-            slide_number = slide_count_offset + quiz_count + discussion_slide_count
-            add_footer(
-                a_slide,
-                presentation_title,
-                slide_number,
-                total_slides,
-                THEME["footer_style"],
-            )
     return slides
@@ -1,5 +1,5 @@
 from pptx.enum.shapes import MSO_SHAPE
-from pptx.util import Pt
+from pptx.enum.text import PP_ALIGN
 from ..constants import COLORS, THEME, FOOTER_Y, SLIDE_WIDTH
 from ..shapes import (
     add_gradient_background,
@@ -8,9 +8,29 @@ from ..shapes import (
     add_shape,
     add_table,
     add_footer,
+    pt,
 )
 from ..localization import t
 
+_CONTENT_SHADOW = THEME["content_box_shadow"]
+_FOOTER_STYLE = THEME["footer_style"]
+
+# Table header styling shared by every key terms slide
+_KT_HEADER_FILL = COLORS["royal_blue"]
+_KT_HEADER_FG = COLORS["text_light"]
+_KT_HEADER_PT = pt(18)
+
+
+def _cell_run(cell, text):
+    """Write ``text`` into ``cell`` and return the first paragraph's run."""
+    if "\n" in text or "\v" in text:  # multi-line values keep their paragraphs
+        cell.text = text
+        p = cell.text_frame.paragraphs[0]
+        return p.runs[0] if p.runs else p.add_run()
+    run = cell.text_frame.paragraphs[0].add_run()
+    run.text = text
+    return run
+
 
 def create_key_terms_slide(prs, content, total_slides):
     key_terms = content.get("keyTerms", [])
@@ -20,6 +40,11 @@ def create_key_terms_slide(prs, content, total_slides):
     total_terms = len(key_terms)
     slides_needed = (total_terms + terms_per_slide - 1) // terms_per_slide
     slides = []
+    keyterms_label = t("keyTerms")
+    continued_label = t("continued")
+    term_label = t("term")
+    definition_label = t("definition")
+    presentation_title = content.get("title") or t("untitledPresentation")
     for slide_idx in range(slides_needed):
         slide = prs.slides.add_slide(prs.slide_layouts[6])
         slides.append(slide)
@@ -27,9 +52,9 @@ def create_key_terms_slide(prs, content, total_slides):
             prs, slide, COLORS["primary"], COLORS["primary_dark"], angle=0
         )
         add_corner_accent(slide, COLORS["accent3"], 1.0, "bottom-left")
-        title = t("keyTerms")
+        title = keyterms_label
         if slide_idx > 0:
-            title += t("continued")
+            title += continued_label
         add_text_box(
             slide,
             title,
@@ -45,7 +70,7 @@ def create_key_terms_slide(prs, content, total_slides):
         end_idx = min(start_idx + terms_per_slide, total_terms)
         terms_for_slide = key_terms[start_idx:end_idx]
         table_height = min(3.5, 0.8 * (len(terms_for_slide) + 1))
-        if THEME["content_box_shadow"]:
+        if _CONTENT_SHADOW:
             add_shape(
                 slide,
                 MSO_SHAPE.RECTANGLE,
@@ -68,68 +93,36 @@ def create_key_terms_slide(prs, content, total_slides):
             alt_row_bg_color=COLORS["light"],
             border_color=COLORS["primary_light"],
         )
-        headers = [
-            {
-                "text": t("term"),
-                "options": {
-                    "fill": {"color": COLORS["royal_blue"]},
-                    "color": COLORS["text_light"],
-                    "fontSize": 18,
-                    "bold": True,
-                    "align": "center",
-                },
-            },
-            {
-                "text": t("definition"),
-                "options": {
-                    "fill": {"color": COLORS["royal_blue"]},
-                    "color": COLORS["text_light"],
-                    "fontSize": 18,
-                    "bold": True,
-                    "align": "center",
-                },
-            },
-        ]
-        for j, cell_data in enumerate(headers):
+        for j, label in enumerate((term_label, definition_label)):
             cell = table.cell(0, j)
-            p = cell.text_frame.paragraphs[0]
-            p.text = cell_data["text"]
-            opts = cell_data["options"]
-            if "fill" in opts and "color" in opts["fill"]:
-                cell.fill.solid()
-                cell.fill.fore_color.rgb = opts["fill"]["color"]
-            if p.runs:
-                run = p.runs[0]
-                run.font.color.rgb = opts["color"]
-                run.font.size = Pt(opts["fontSize"])
-                run.font.bold = opts["bold"]
-            if opts.get("align") == "center":
-                p.alignment = 1  # PP_ALIGN.CENTER value
+            run = _cell_run(cell, label)
+            cell.fill.solid()
+            cell.fill.fore_color.rgb = _KT_HEADER_FILL
+            run.font.color.rgb = _KT_HEADER_FG
+            run.font.size = _KT_HEADER_PT
+            run.font.bold = True
+            cell.text_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
         for i, term in enumerate(terms_for_slide):
             row_idx = i + 1
             even = i % 2 == 0
             bg = COLORS["background"] if even else COLORS["light"]
             term_cell = table.cell(row_idx, 0)
-            term_cell.text = term.get("term", "")
+            r = _cell_run(term_cell, term.get("term", ""))
             term_cell.fill.solid()
             term_cell.fill.fore_color.rgb = bg
-            if term_cell.text_frame.paragraphs[0].runs:
-                r = term_cell.text_frame.paragraphs[0].runs[0]
-                r.font.bold = True
-                r.font.size = Pt(16)
-                r.font.color.rgb = COLORS["primary_dark"]
+            r.font.bold = True
+            r.font.size = pt(16)
+            r.font.color.rgb = COLORS["primary_dark"]
             def_cell = table.cell(row_idx, 1)
-            def_cell.text = term.get("definition", "")
+            dr = _cell_run(def_cell, term.get("definition", ""))
             def_cell.fill.solid()
             def_cell.fill.fore_color.rgb = bg
-            if def_cell.text_frame.paragraphs[0].runs:
-                dr = def_cell.text_frame.paragraphs[0].runs[0]
-                dr.font.size = Pt(14)
+            dr.font.size = pt(14)
         add_footer(
             slide,
-            (content.get("title") or t("untitledPresentation")),
+            presentation_title,
             slide_idx + 2,
             total_slides,
-            THEME["footer_style"],
+            _FOOTER_STYLE,
         )
     return slides
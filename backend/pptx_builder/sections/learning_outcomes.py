@@ -5,6 +5,10 @@ from ..constants import COLORS, SLIDE_WIDTH, THEME, FOOTER_Y
 from ..shapes import add_shape, add_text_box, add_footer
 from ..localization import t
 
+_FOOTER_STYLE = THEME["footer_style"]
+
+_NUM_PREFIX = re.compile(r"^\d+\.\s*")
+
 
 def create_learning_outcomes_slide(prs, content, total_slides):
     slide = prs.slides.add_slide(prs.slide_layouts[6])
@@ -57,7 +61,8 @@ def create_learning_outcomes_slide(prs, content, total_slides):
     y = 2.0
     bullet_colors = [COLORS["emerald"], COLORS["medium_purple"], COLORS["emerald"]]
     for idx, outcome in enumerate(learning_outcomes):
-        cleaned = re.sub(r"^\d+\.\s*", "", outcome)
+        # Only numbered outcomes need the regex
+        cleaned = _NUM_PREFIX.sub("", outcome) if outcome[:1].isdigit() else outcome
         add_shape(
             slide,
             MSO_SHAPE.RECTANGLE,
@@ -77,6 +82,7 @@ def create_learning_outcomes_slide(prs, content, total_slides):
             font_size=20,
             color=COLORS["text"],
             vertical_alignment=MSO_ANCHOR.MIDDLE,
+            auto_fit=True,
         )
         y += 0.6
     add_footer(
@@ -84,6 +90,6 @@ def create_learning_outcomes_slide(prs, content, total_slides):
         (content.get("title") or t("untitledPresentation")),
         1,
         total_slides,
-        THEME["footer_style"],
+        _FOOTER_STYLE,
     )
     return slide
@@ -1,22 +1,45 @@
-import json
 from pptx.enum.shapes import MSO_SHAPE
 from pptx.enum.text import MSO_ANCHOR, PP_ALIGN
 from ..constants import COLORS, SLIDE_WIDTH, FOOTER_Y, THEME
-from ..shapes import add_shape, add_text_box, add_footer
+from ..shapes import ShapeBatch, add_shape, add_text_box, add_footer
 from ..localization import t
+from ..slide_numbering import compute_slide_offsets
+from ..utils import as_text
 
+_FOOTER_STYLE = THEME["footer_style"]
 
-def create_quiz_slides(prs, content, total_slides):
+# Answer options are laid out two per row, each with a lettered circle
+_OPTIONS_PER_ROW = 2
+_OPTION_WIDTH = 4.3
+_OPTION_HEIGHT = 1.0
+_OPTION_GAP = 0.4
+_OPTION_START_Y = 2.2
+_CIRCLE_SIZE = 0.6
+
+
+def _option_geometry(opt_idx):
+    """Return ``(ox, oy, cx, cy, text_x)`` for an option."""
+    row = opt_idx // _OPTIONS_PER_ROW
+    col = opt_idx % _OPTIONS_PER_ROW
+    ox = 0.5 + col * (_OPTION_WIDTH + _OPTION_GAP)
+    oy = _OPTION_START_Y + row * (_OPTION_HEIGHT + 0.4)
+    cx = ox + 0.2
+    cy = oy + (_OPTION_HEIGHT - _CIRCLE_SIZE) / 2
+    text_x = cx + _CIRCLE_SIZE + 0.2
+    return ox, oy, cx, cy, text_x
+
+
+_OPTION_GEOM = [_option_geometry(i) for i in range(8)]
+
+
+def create_quiz_slides(prs, content, total_slides, offsets=None):
     assessment_ideas = content.get("assessmentIdeas", [])
     slides = []
-    slide_count_offset = (
-        2
-        + len(content.get("keyTerms", [])) // 4
-        - 1
-        + len([s for i, s in enumerate(content.get("slides", [])) if i != 1])
-        + len(content.get("activities", [])) * 2
-        + 1
-    )
+    offsets = offsets or compute_slide_offsets(content)
+    slide_count_offset = offsets.base_offset
+    correct_label = t("correctAnswer")
+    explanation_label = t("explanation")
+    presentation_title = content.get("title") or t("untitledPresentation")
     quiz_slide_count = 0
     for idea in assessment_ideas:
         if "quiz" not in idea.get("type", "").lower():
@@ -28,254 +51,233 @@ def create_quiz_slides(prs, content, total_slides):
                 continue
             q_slide = prs.slides.add_slide(prs.slide_layouts[6])
             slides.append(q_slide)
-            quiz_slide_count += 1
-            add_shape(
-                q_slide,
-                MSO_SHAPE.RECTANGLE,
-                0,
-                0,
-                SLIDE_WIDTH,
-                1.0,
-                fill_color=COLORS["primary"],
-            )
-            add_text_box(
-                q_slide,
-                t("quizQuestion", num=q_idx + 1),
-                0.5,
-                0.2,
-                9.0,
-                0.6,
-                font_size=36,
-                bold=True,
-                color=COLORS["text_light"],
-                alignment=PP_ALIGN.CENTER,
-                vertical_alignment=MSO_ANCHOR.MIDDLE,
-            )
-            add_shape(
-                q_slide,
-                MSO_SHAPE.ROUNDED_RECTANGLE,
-                0.5,
-                1.1,
-                9.0,
-                0.8,
-                fill_color=COLORS["light"],
-                line_color=COLORS["light"],
-                line_width=1,
-            )
-            add_text_box(
-                q_slide,
-                question_text,
-                0.7,
-                1.2,
-                8.6,
-                0.6,
-                font_size=20,
-                bold=True,
-                color=COLORS["text"],
-            )
-            options_per_row = 2
-            option_width = 4.3
-            option_height = 1.0
-            option_gap = 0.4
-            start_y = 2.2
-            for opt_idx, option in enumerate(options):
-                row = opt_idx // options_per_row
-                col = opt_idx % options_per_row
-                ox = 0.5 + col * (option_width + option_gap)
-                oy = start_y + row * (option_height + 0.4)
+            q_slide.shapes.turbo_add_enabled = True
+            with ShapeBatch(q_slide):
+                quiz_slide_count += 1
                 add_shape(
                     q_slide,
-                    MSO_SHAPE.ROUNDED_RECTANGLE,
-                    ox,
-                    oy,
-                    option_width,
-                    option_height,
-                    fill_color=COLORS["light"],
-                    line_color=COLORS["light"],
-                )
-                circle_size = 0.6
-                cx = ox + 0.2
-                cy = oy + (option_height - circle_size) / 2
-                add_shape(
-                    q_slide,
-                    MSO_SHAPE.OVAL,
-                    cx,
-                    cy,
-                    circle_size,
-                    circle_size,
+                    MSO_SHAPE.RECTANGLE,
+                    0,
+                    0,
+                    SLIDE_WIDTH,
+                    1.0,
                     fill_color=COLORS["primary"],
                 )
                 add_text_box(
                     q_slide,
-                    chr(65 + opt_idx),
-                    cx,
-                    cy,
-                    circle_size,
-                    circle_size,
-                    font_size=24,
+                    t("quizQuestion", num=q_idx + 1),
+                    0.5,
+                    0.2,
+                    9.0,
+                    0.6,
+                    font_size=36,
                     bold=True,
                     color=COLORS["text_light"],
                     alignment=PP_ALIGN.CENTER,
                     vertical_alignment=MSO_ANCHOR.MIDDLE,
                 )
-                text_x = cx + circle_size + 0.2
-                add_text_box(
-                    q_slide,
-                    option,
-                    text_x,
-                    oy,
-                    option_width - (text_x - ox) - 0.2,
-                    option_height,
-                    font_size=18,
-                    color=COLORS["text"],
-                    alignment=PP_ALIGN.CENTER,
-                    vertical_alignment=MSO_ANCHOR.MIDDLE,
-                )
-            presentation_title = content.get("title") or t("untitledPresentation")
-            slide_number = slide_count_offset + quiz_slide_count
-            add_footer(
-                q_slide,
-                presentation_title,
-                slide_number,
-                total_slides,
-                THEME["footer_style"],
-            )
-            # Answer slide
-            a_slide = prs.slides.add_slide(prs.slide_layouts[6])
-            slides.append(a_slide)
-            quiz_slide_count += 1
-            add_shape(
-                a_slide,
-                MSO_SHAPE.RECTANGLE,
-                0,
-                0,
-                SLIDE_WIDTH,
-                1.2,
-                fill_color=COLORS["primary"],
-            )
-            add_text_box(
-                a_slide,
-                t("quizAnswer", num=q_idx + 1),
-                0.5,
-                0.3,
-                9.0,
-                0.6,
-                font_size=40,
-                bold=True,
-                color=COLORS["text_light"],
-                alignment=PP_ALIGN.CENTER,
-                vertical_alignment=MSO_ANCHOR.MIDDLE,
-            )
-            add_shape(
-                a_slide,
-                MSO_SHAPE.ROUNDED_RECTANGLE,
-                0.5,
-                1.4,
-                9.0,
-                0.8,
-                fill_color=COLORS["light"],
-                line_color=COLORS["light"],
-                line_width=1,
-            )
-            add_text_box(
-                a_slide,
-                f"{t('question', text=question_text)}",
-                0.7,
-                1.5,
-                8.6,
-                0.6,
-                font_size=18,
-                italic=True,
-                color=COLORS["text"],
-            )
-            correct_answer = question.get("correctAnswer", "")
-            if correct_answer:
                 add_shape(
-                    a_slide,
+                    q_slide,
                     MSO_SHAPE.ROUNDED_RECTANGLE,
                     0.5,
-                    2.4,
+                    1.1,
                     9.0,
-                    1.0,
-                    fill_color=COLORS["dark_alt"],
-                    line_color=COLORS["success"],
-                    line_width=3,
+                    0.8,
+                    fill_color=COLORS["light"],
+                    line_color=COLORS["light"],
+                    line_width=1,
                 )
                 add_text_box(
-                    a_slide,
-                    t("correctAnswer"),
+                    q_slide,
+                    question_text,
                     0.7,
-                    2.5,
+                    1.2,
                     8.6,
-                    0.4,
+                    0.6,
                     font_size=20,
                     bold=True,
-                    color=COLORS["warning"],
+                    color=COLORS["text"],
+                    auto_fit=True,
+                )
+                for opt_idx, option in enumerate(options):
+                    if opt_idx < len(_OPTION_GEOM):
+                        ox, oy, cx, cy, text_x = _OPTION_GEOM[opt_idx]
+                    else:
+                        ox, oy, cx, cy, text_x = _option_geometry(opt_idx)
+                    # The option text is inset past the letter circle, where the
+                    # separate text box used to start
+                    add_shape(
+                        q_slide,
+                        MSO_SHAPE.ROUNDED_RECTANGLE,
+                        ox,
+                        oy,
+                        _OPTION_WIDTH,
+                        _OPTION_HEIGHT,
+                        fill_color=COLORS["light"],
+                        line_color=COLORS["light"],
+                        text=option,
+                        font_size=18,
+                        text_color=COLORS["text"],
+                        text_margins=(text_x - ox + 0.1, 0.3),
+                        auto_fit=True,
+                    )
+                    add_shape(
+                        q_slide,
+                        MSO_SHAPE.OVAL,
+                        cx,
+                        cy,
+                        _CIRCLE_SIZE,
+                        _CIRCLE_SIZE,
+                        fill_color=COLORS["primary"],
+                        text=chr(65 + opt_idx),
+                        font_size=24,
+                        text_color=COLORS["text_light"],
+                        text_bold=True,
+                    )
+                slide_number = slide_count_offset + quiz_slide_count
+                add_footer(
+                    q_slide,
+                    presentation_title,
+                    slide_number,
+                    total_slides,
+                    _FOOTER_STYLE,
+                )
+            # Answer slide
+            a_slide = prs.slides.add_slide(prs.slide_layouts[6])
+            slides.append(a_slide)
+            a_slide.shapes.turbo_add_enabled = True
+            with ShapeBatch(a_slide):
+                quiz_slide_count += 1
+                add_shape(
+                    a_slide,
+                    MSO_SHAPE.RECTANGLE,
+                    0,
+                    0,
+                    SLIDE_WIDTH,
+                    1.2,
+                    fill_color=COLORS["primary"],
                 )
                 add_text_box(
                     a_slide,
-                    correct_answer,
-                    0.7,
-                    2.9,
-                    8.6,
-                    0.4,
-                    font_size=18,
+                    t("quizAnswer", num=q_idx + 1),
+                    0.5,
+                    0.3,
+                    9.0,
+                    0.6,
+                    font_size=40,
+                    bold=True,
                     color=COLORS["text_light"],
+                    alignment=PP_ALIGN.CENTER,
+                    vertical_alignment=MSO_ANCHOR.MIDDLE,
                 )
-            explanation = question.get("explanation", "")
-            if explanation:
                 add_shape(
                     a_slide,
                     MSO_SHAPE.ROUNDED_RECTANGLE,
                     0.5,
-                    3.6,
-                    9.0,
                     1.4,
+                    9.0,
+                    0.8,
                     fill_color=COLORS["light"],
-                    line_color=COLORS["primary_light"],
+                    line_color=COLORS["light"],
                     line_width=1,
                 )
-                add_shape(
-                    a_slide,
-                    MSO_SHAPE.RECTANGLE,
-                    0.7,
-                    3.7,
-                    0.1,
-                    1.2,
-                    fill_color=COLORS["primary"],
-                )
                 add_text_box(
                     a_slide,
-                    t("explanation"),
-                    0.9,
-                    3.7,
-                    8.5,
-                    0.4,
-                    font_size=20,
-                    bold=True,
+                    f"{t('question', text=question_text)}",
+                    0.7,
+                    1.5,
+                    8.6,
+                    0.6,
+                    font_size=18,
+                    italic=True,
                     color=COLORS["text"],
+                    auto_fit=True,
                 )
-                add_text_box(
+                correct_answer = question.get("correctAnswer", "")
+                if correct_answer:
+                    add_shape(
+                        a_slide,
+                        MSO_SHAPE.ROUNDED_RECTANGLE,
+                        0.5,
+                        2.4,
+                        9.0,
+                        1.0,
+                        fill_color=COLORS["dark_alt"],
+                        line_color=COLORS["success"],
+                        line_width=3,
+                    )
+                    add_text_box(
+                        a_slide,
+                        correct_label,
+                        0.7,
+                        2.5,
+                        8.6,
+                        0.4,
+                        font_size=20,
+                        bold=True,
+                        color=COLORS["warning"],
+                    )
+                    add_text_box(
+                        a_slide,
+                        correct_answer,
+                        0.7,
+                        2.9,
+                        8.6,
+                        0.4,
+                        font_size=18,
+                        color=COLORS["text_light"],
+                        auto_fit=True,
+                    )
+                explanation = question.get("explanation", "")
+                if explanation:
+                    add_shape(
+                        a_slide,
+                        MSO_SHAPE.ROUNDED_RECTANGLE,
+                        0.5,
+                        3.6,
+                        9.0,
+                        1.4,
+                        fill_color=COLORS["light"],
+                        line_color=COLORS["primary_light"],
+                        line_width=1,
+                    )
+                    add_shape(
+                        a_slide,
+                        MSO_SHAPE.RECTANGLE,
+                        0.7,
+                        3.7,
+                        0.1,
+                        1.2,
+                        fill_color=COLORS["primary"],
+                    )
+                    add_text_box(
+                        a_slide,
+                        explanation_label,
+                        0.9,
+                        3.7,
+                        8.5,
+                        0.4,
+                        font_size=20,
+                        bold=True,
+                        color=COLORS["text"],
+                    )
+                    add_text_box(
+                        a_slide,
+                        as_text(explanation),
+                        0.9,
+                        4.2,
+                        8.5,
+                        0.7,
+                        font_size=16,
+                        color=COLORS["text"],
+                        auto_fit=True,
+                    )
+                slide_number = slide_count_offset + quiz_slide_count
+                add_footer(
                     a_slide,
-                    (
-                        explanation
-                        if isinstance(explanation, str)
-                        else json.dumps(explanation)
-                    ),
-                    0.9,
-                    4.2,
-                    8.5,
-                    0.7,
-                    font_size=16,
-                    color=COLORS["text"],
+                    presentation_title,
+                    slide_number,
+                    total_slides,
+                    _FOOTER_STYLE,
                 )
-            presentation_title = content.get("title") or t("untitledPresentation")
-            slide_number = slide_count_offset + quiz_slide_count
-            add_footer(
-                a_slide,
-                presentation_title,
-                slide_number,
-                total_slides,
-                THEME["footer_style"],
-            )
     return slides
@@ -2,42 +2,30 @@ from pptx.enum.shapes import MSO_SHAPE
 from ..constants import COLORS, SLIDE_WIDTH, FOOTER_Y, THEME
 from ..shapes import add_shape, add_text_box, add_footer
 from ..localization import t
+from ..slide_numbering import compute_slide_offsets
 
+_CONTENT_SHADOW = THEME["content_box_shadow"]
+_FOOTER_STYLE = THEME["footer_style"]
 
-def create_further_readings_slides(prs, content, total_slides):
+
+def create_further_readings_slides(prs, content, total_slides, offsets=None):
     readings = content.get("furtherReadings", [])
     if not readings:
         return []
     slides = []
-    slide_count_offset = (
-        2
-        + len(content.get("keyTerms", [])) // 4
-        - 1
-        + len([s for i, s in enumerate(content.get("slides", [])) if i != 1])
-        + len(content.get("activities", [])) * 2
-        + 1
-    )
-    quiz_count = 0
-    for idea in content.get("assessmentIdeas", []):
-        if "quiz" in idea.get("type", "").lower():
-            quiz_count += (
-                len([q for q in idea.get("exampleQuestions", []) if q.get("options")])
-                * 2
-            )
-    discussion_count = 0
-    for idea in content.get("assessmentIdeas", []):
-        if "discussion" in idea.get("type", "").lower():
-            discussion_count += (
-                len(
-                    idea.get("exampleQuestions", [])
-                    if idea.get("exampleQuestions")
-                    else []
-                )
-                * 2
-            )
+    offsets = offsets or compute_slide_offsets(content)
+    slide_count_offset = offsets.base_offset
+    quiz_count = offsets.quiz_count * 2
+    discussion_count = offsets.discussion_count * 2
     readings_per_slide = 2
     total_readings = len(readings)
     slides_needed = (total_readings + readings_per_slide - 1) // readings_per_slide
+    readings_label = t("furtherReadings")
+    continued_label = t("continued")
+    untitled_label = t("untitledReading")
+    unknown_author = t("unknownAuthor")
+    author_label = t("author")
+    presentation_title = content.get("title") or t("untitledPresentation")
     for slide_idx in range(slides_needed):
         slide = prs.slides.add_slide(prs.slide_layouts[6])
         slides.append(slide)
@@ -50,9 +38,9 @@ def create_further_readings_slides(prs, content, total_slides):
             0.8,
             fill_color=COLORS["primary"],
         )
-        title = t("furtherReadings")
+        title = readings_label
         if slide_idx > 0:
-            title += t("continued")
+            title += continued_label
         add_text_box(
             slide,
             title,
@@ -64,7 +52,7 @@ def create_further_readings_slides(prs, content, total_slides):
             bold=True,
             color=COLORS["text_light"],
         )
-        if THEME["content_box_shadow"]:
+        if _CONTENT_SHADOW:
             add_shape(
                 slide,
                 MSO_SHAPE.ROUNDED_RECTANGLE,
@@ -83,7 +71,7 @@ def create_further_readings_slides(prs, content, total_slides):
         readings_for_slide = readings[start_idx:end_idx]
         y = 1.2
         for i, reading in enumerate(readings_for_slide):
-            reading_title = reading.get("title") or t("untitledReading")
+            reading_title = reading.get("title") or untitled_label
             add_shape(
                 slide,
                 MSO_SHAPE.RECTANGLE,
@@ -103,13 +91,14 @@ def create_further_readings_slides(prs, content, total_slides):
                 font_size=20,
                 bold=True,
                 color=COLORS["primary"],
+                auto_fit=True,
             )
             y += 0.5
-            reading_author = reading.get("author") or t("unknownAuthor")
+            reading_author = reading.get("author") or unknown_author
             reading_description = reading.get("readingDescription", "")
             add_text_box(
                 slide,
-                f"{t('author')} {reading_author}",
+                f"{author_label} {reading_author}",
                 0.9,
                 y,
                 8.3,
@@ -117,6 +106,7 @@ def create_further_readings_slides(prs, content, total_slides):
                 font_size=16,
                 italic=True,
                 color=COLORS["primary"],
+                auto_fit=True,
             )
             y += 0.4
             add_text_box(
@@ -128,6 +118,7 @@ def create_further_readings_slides(prs, content, total_slides):
                 0.6,
                 font_size=16,
                 color=COLORS["text"],
+                auto_fit=True,
             )
             if i < len(readings_for_slide) - 1:
                 y += 0.8
@@ -149,9 +140,9 @@ def create_further_readings_slides(prs, content, total_slides):
         )
         add_footer(
             slide,
-            (content.get("title") or t("untitledPresentation")),
+            presentation_title,
             slide_number,
             total_slides,
-            THEME["footer_style"],
+            _FOOTER_STYLE,
         )
     return slides
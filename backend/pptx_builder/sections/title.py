@@ -4,10 +4,13 @@ from ..constants import COLORS, SLIDE_WIDTH, SLIDE_HEIGHT, THEME
 from ..shapes import add_text_box, add_shape, add_corner_accent, add_gradient_background
 from ..localization import t
 
+_USE_GRADIENTS = THEME["use_gradients"]
+_CORNER_ACCENT = THEME["corner_accent"]
+
 
 def create_title_slide(prs, content):
     slide = prs.slides.add_slide(prs.slide_layouts[6])
-    if THEME["use_gradients"]:
+    if _USE_GRADIENTS:
         add_gradient_background(
             prs, slide, COLORS["gradient_start"], COLORS["gradient_end"], angle=135
         )
@@ -21,7 +24,7 @@ def create_title_slide(prs, content):
             SLIDE_HEIGHT,
             fill_color=COLORS["primary_dark"],
         )
-    if THEME["corner_accent"]:
+    if _CORNER_ACCENT:
         add_corner_accent(slide, COLORS["accent1"], 2.0, "top-right")
         add_corner_accent(slide, COLORS["accent2"], 1.5, "bottom-left")
     title = content.get("title", t("untitledPresentation"))
@@ -37,6 +40,7 @@ def create_title_slide(prs, content):
         color=COLORS["text_light"],
         alignment=PP_ALIGN.CENTER,
         shadow=True,
+        auto_fit=True,
     )
     ct_names = t("contentTypeNames")
     diff_names = t("difficultyNames")
@@ -1,9 +1,118 @@
+import copy
+from contextlib import contextmanager
+from functools import lru_cache
 from pptx.util import Inches, Pt
 from pptx.enum.text import PP_ALIGN, MSO_ANCHOR, MSO_AUTO_SIZE
 from pptx.enum.shapes import MSO_SHAPE
 from pptx.dml.color import RGBColor
+from pptx.dml.effect import ShadowFormat
+from pptx.dml.fill import FillFormat
+from pptx.oxml.ns import qn
+from pptx.oxml.shapes.autoshape import CT_Shape
+from pptx.shapes.autoshape import AutoShapeType
 from .constants import COLORS, THEME, SLIDE_WIDTH, SLIDE_HEIGHT, FOOTER_Y
 
+# Memoized unit converters: the builders reuse a small set of layout values,
+# so repeated conversions become cache hits instead of new Length objects.
+inches = lru_cache(maxsize=256)(Inches)
+pt = lru_cache(maxsize=64)(Pt)
+
+_BLACK = RGBColor(0, 0, 0)
+
+# Not every python-pptx release exposes fill transparency or shadow styling;
+# where a property is missing, assigning it would only set a plain Python
+# attribute, so probe once here instead of guarding every shape.
+_SUPPORTS_TRANSPARENCY = hasattr(FillFormat, "transparency")
+_SUPPORTS_SHADOW_STYLE = all(
+    hasattr(ShadowFormat, name)
+    for name in ("visible", "blur_radius", "distance", "angle", "color", "transparency")
+)
+
+# Shape trees with an open ShapeBatch: new shapes are built detached,
+# collected here and appended with a single spTree.extend() on exit.
+_pending_shapes = {}
+
+
+class ShapeBatch:
+    """Context manager that defers shape appends for ``slide``.
+
+    Shapes created through this module while the batch is open are built
+    detached and appended to the slide's shape tree in one call on exit.
+    Nested batches on the same slide are folded into the outermost one.
+    """
+
+    def __init__(self, slide):
+        self._sp_tree = slide.shapes._spTree
+        self._owner = False
+
+    def __enter__(self):
+        if self._sp_tree not in _pending_shapes:
+            _pending_shapes[self._sp_tree] = []
+            self._owner = True
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if self._owner:
+            _flush_pending(self._sp_tree)
+            del _pending_shapes[self._sp_tree]
+        return False
+
+
+def _flush_pending(sp_tree):
+    pending = _pending_shapes.get(sp_tree)
+    if not pending:
+        return
+    ext_lst = sp_tree.find(qn("p:extLst"))
+    if ext_lst is None:
+        sp_tree.extend(pending)
+    else:
+        for element in pending:
+            ext_lst.addprevious(element)
+    pending.clear()
+
+
+def _new_sp(slide, shape_type, left, top, width, height):
+    """Create an autoshape, or a textbox when ``shape_type`` is None."""
+    shapes = slide.shapes
+    pending = _pending_shapes.get(shapes._spTree)
+    if pending is None:
+        if shape_type is None:
+            return shapes.add_textbox(left, top, width, height)
+        return shapes.add_shape(shape_type, left, top, width, height)
+    # Pending elements are not in the tree yet, so keep ids above them
+    id_ = shapes._next_shape_id
+    if pending:
+        id_ = max(id_, pending[-1].shape_id + 1)
+    if shape_type is None:
+        sp = CT_Shape.new_textbox_sp(
+            id_, "TextBox %d" % (id_ - 1), left, top, width, height
+        )
+    else:
+        autoshape_type = AutoShapeType(shape_type)
+        name = "%s %d" % (autoshape_type.basename, id_ - 1)
+        sp = CT_Shape.new_autoshape_sp(
+            id_, name, autoshape_type.prst, left, top, width, height
+        )
+    pending.append(sp)
+    return shapes._shape_factory(sp)
+
+
+def _apply_shadow(shape):
+    sh = shape.shadow
+    sh.inherit = False
+    if _SUPPORTS_SHADOW_STYLE:
+        sh.visible = True
+        sh.blur_radius = pt(5)
+        sh.distance = pt(3)
+        sh.angle = 45
+        sh.color.rgb = _BLACK
+        sh.transparency = 0.7
+
+
+def add_plain_textbox(slide, left, top, width, height):
+    """Add an empty textbox; position and size are EMU lengths."""
+    return _new_sp(slide, None, left, top, width, height)
+
 
 def add_text_box(
     slide,
@@ -22,24 +131,23 @@ def add_text_box(
     bg_color=None,
     border_color=None,
     shadow=False,
+    auto_fit=False,
 ):
-    textbox = slide.shapes.add_textbox(
-        Inches(left), Inches(top), Inches(width), Inches(height)
+    textbox = _new_sp(
+        slide, None, inches(left), inches(top), inches(width), inches(height)
     )
     tf = textbox.text_frame
     tf.word_wrap = True
     tf.vertical_anchor = vertical_alignment
-    try:
+    if auto_fit:  # only free text that may overflow its box needs shrinking
         tf.auto_size = MSO_AUTO_SIZE.TEXT_TO_FIT_SHAPE
-    except:
-        pass
     p = tf.paragraphs[0]
     p.alignment = alignment
     p.level = level
     run = p.add_run()
     run.text = text
     font = run.font
-    font.size = Pt(font_size)
+    font.size = pt(font_size)
     font.bold = bold
     font.italic = italic
     font.color.rgb = color
@@ -50,19 +158,9 @@ def add_text_box(
     if border_color:
         line = textbox.line
         line.color.rgb = border_color
-        line.width = Pt(1)
+        line.width = pt(1)
     if shadow and THEME["content_box_shadow"]:
-        try:
-            sh = textbox.shadow
-            sh.inherit = False
-            sh.visible = True
-            sh.blur_radius = Pt(5)
-            sh.distance = Pt(3)
-            sh.angle = 45
-            sh.color.rgb = RGBColor(0, 0, 0)
-            sh.transparency = 0.7
-        except:
-            pass
+        _apply_shadow(textbox)
     return textbox
 
 
@@ -78,41 +176,107 @@ def add_shape(
     line_width=None,
     shadow=False,
     opacity=1.0,
+    text=None,
+    font_size=18,
+    text_color=COLORS["text"],
+    text_bold=False,
+    text_align=PP_ALIGN.CENTER,
+    text_margins=None,
+    auto_fit=False,
 ):
-    shape = slide.shapes.add_shape(
-        shape_type, Inches(left), Inches(top), Inches(width), Inches(height)
+    """Add an autoshape, optionally with ``text`` in its own text frame.
+
+    The text is vertically centered; ``text_margins`` is an optional
+    ``(left, right)`` inset in inches, and ``auto_fit`` shrinks text that
+    would overflow the shape.
+    """
+    shape = _new_sp(
+        slide, shape_type, inches(left), inches(top), inches(width), inches(height)
     )
     if fill_color:
         shape.fill.solid()
         shape.fill.fore_color.rgb = fill_color
-        if opacity < 1.0:
-            try:
-                shape.fill.transparency = 1.0 - opacity
-            except:
-                pass
+        if opacity < 1.0 and _SUPPORTS_TRANSPARENCY:
+            shape.fill.transparency = 1.0 - opacity
     if line_color:
         shape.line.color.rgb = line_color
     if line_width is not None:
-        shape.line.width = Pt(line_width)
+        shape.line.width = pt(line_width)
     if shadow:
-        try:
-            sh = shape.shadow
-            sh.inherit = False
-            sh.visible = True
-            sh.blur_radius = Pt(5)
-            sh.distance = Pt(3)
-            sh.angle = 45
-            sh.color.rgb = RGBColor(0, 0, 0)
-            sh.transparency = 0.7
-        except:
-            pass
+        _apply_shadow(shape)
+    if text is not None:
+        tf = shape.text_frame
+        tf.word_wrap = True
+        tf.vertical_anchor = MSO_ANCHOR.MIDDLE
+        if auto_fit:
+            tf.auto_size = MSO_AUTO_SIZE.TEXT_TO_FIT_SHAPE
+        if text_margins is not None:
+            tf.margin_left, tf.margin_right = (inches(m) for m in text_margins)
+        p = tf.paragraphs[0]
+        p.alignment = text_align
+        run = p.add_run()
+        run.text = text
+        font = run.font
+        font.size = pt(font_size)
+        font.bold = text_bold
+        font.color.rgb = text_color
     return shape
 
 
+def add_standard_header(
+    slide, title, *, font_size=32, bar_color=COLORS["primary"], card=None, **card_style
+):
+    """Add the header bar, title and optional rounded card in one append.
+
+    ``bar_color=None`` skips the bar for slides whose background already
+    provides it. ``card`` is a ``(left, top, width, height)`` tuple and
+    ``card_style`` is passed through to ``add_shape``. Returns the shapes
+    created, in order, so callers can clone them onto similar slides.
+    """
+    header = []
+    with ShapeBatch(slide):
+        if bar_color is not None:
+            bar = add_shape(
+                slide,
+                MSO_SHAPE.RECTANGLE,
+                0,
+                0,
+                SLIDE_WIDTH,
+                0.8,
+                fill_color=bar_color,
+            )
+            header.append(bar)
+        title_box = add_text_box(
+            slide,
+            title,
+            0.5,
+            0.1,
+            9.0,
+            0.6,
+            font_size=font_size,
+            bold=True,
+            color=COLORS["text_light"],
+            auto_fit=True,
+        )
+        header.append(title_box)
+        if card is not None:
+            header.append(
+                add_shape(slide, MSO_SHAPE.ROUNDED_RECTANGLE, *card, **card_style)
+            )
+    return header
+
+
+def clone_shape(shape, slide):
+    """Append a copy of an already-built shape's XML to ``slide``."""
+    element = copy.deepcopy(shape._element)
+    _flush_pending(slide.shapes._spTree)
+    element.nvSpPr.cNvPr.id = slide.shapes._next_shape_id
+    slide.shapes._spTree.insert_element_before(element, "p:extLst")
+    return slide.shapes._shape_factory(element)
+
+
 def add_gradient_background(prs, slide, start_color, end_color, angle=90):
-    shape = slide.shapes.add_shape(
-        MSO_SHAPE.RECTANGLE, 0, 0, prs.slide_width, prs.slide_height
-    )
+    shape = _new_sp(slide, MSO_SHAPE.RECTANGLE, 0, 0, prs.slide_width, prs.slide_height)
     shape.line.fill.background()
     try:
         fill = shape.fill
@@ -138,22 +302,26 @@ def add_corner_accent(slide, color=COLORS["accent1"], size=1.0, position="top-ri
         left, top = SLIDE_WIDTH - size, SLIDE_HEIGHT - size
     else:
         left, top = 0, SLIDE_HEIGHT - size
-    shape = slide.shapes.add_shape(
-        MSO_SHAPE.RIGHT_TRIANGLE, Inches(left), Inches(top), Inches(size), Inches(size)
+    shape = _new_sp(
+        slide,
+        MSO_SHAPE.RIGHT_TRIANGLE,
+        inches(left),
+        inches(top),
+        inches(size),
+        inches(size),
     )
     shape.fill.solid()
     shape.fill.fore_color.rgb = color
     shape.line.fill.background()
-    try:
+    if _SUPPORTS_TRANSPARENCY:
         shape.fill.transparency = 0.3
-    except:
-        pass
     return shape
 
 
 def add_table(slide, rows, cols, left, top, width, height, **kwargs):
+    _flush_pending(slide.shapes._spTree)  # graphic frames are added directly
     table = slide.shapes.add_table(
-        rows, cols, Inches(left), Inches(top), Inches(width), Inches(height)
+        rows, cols, inches(left), inches(top), inches(width), inches(height)
     ).table
     return table
 
@@ -183,6 +351,7 @@ def add_footer(slide, title_text, slide_number, total_slides, style="modern"):
             font_size=10,
             color=COLORS["primary"],
             italic=True,
+            auto_fit=True,
         )
         add_text_box(
             slide,
@@ -205,6 +374,7 @@ def add_footer(slide, title_text, slide_number, total_slides, style="modern"):
             0.3,
             font_size=10,
             color=COLORS["royal_blue"],
+            auto_fit=True,
         )
         add_text_box(
             slide,
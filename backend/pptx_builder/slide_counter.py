@@ -1,105 +1,103 @@
 from .utils import clean_slide_title
 from .constants import FOOTER_Y
-import math
 
+# Agenda layout in whole hundredths of an inch (0.5in per section title,
+# 0.35in per item), the same units create_agenda_slide paginates in
+_SECTION_UNITS = 50
+_ITEM_UNITS = 35
+_AVAILABLE_UNITS = round((FOOTER_Y - 1.2) * 100)
 
-def calculate_total_slides(content):
-    total = 0
-    total += 1  # Title
-    # Agenda slides
-    agenda_items = []
-    agenda_items.append(
-        {
-            "title": "Introduction",
-            "items": ["Learning Outcomes", "Key Terms & Concepts"],
-        }
-    )
-    content_slides = []
-    for slide_content in content.get("slides", []):
-        if slide_content.get("title", ""):
-            title = clean_slide_title(slide_content.get("title", ""))
-            if title:
-                content_slides.append(title)
-    if content_slides:
-        agenda_items.append({"title": "Main Content", "items": content_slides})
-    activities = []
-    for activity in content.get("activities", []):
-        activities.append(activity.get("title", ""))
+_FACIL_MARKERS = ("Facilitation notes:", "Facilitation Notes:", "Facilitator notes:")
+
+
+def _count_extras(activities, ideas, readings):
+    """Count what activities, assessment ideas and readings add to a deck.
+
+    Returns ``(agenda_sections, agenda_items, slides)``.
+    """
+    agenda_sections = 0
+    agenda_items = 0
+    slides = 0
+    has_facilitation_notes = False
+    for activity in activities:
+        if not has_facilitation_notes:
+            description = activity.get("description", "")
+            has_facilitation_notes = any(m in description for m in _FACIL_MARKERS)
     if activities:
-        agenda_items.append({"title": "Activities", "items": activities})
-    knowledge_items = []
+        agenda_sections += 1
+        agenda_items += len(activities)
+        slides += len(activities) * 2
     quiz_count = 0
     discussion_count = 0
-    for idea in content.get("assessmentIdeas", []):
+    discussion_slides = 0
+    for idea in ideas:
         idea_type = idea.get("type", "").lower()
-        if "quiz" in idea_type:
-            quiz_count += len(
-                [q for q in idea.get("exampleQuestions", []) if q.get("options")]
-            )
-        elif "discussion" in idea_type:
-            discussion_count += len(
-                idea.get("exampleQuestions", []) if idea.get("exampleQuestions") else []
-            )
-    if quiz_count > 0:
-        knowledge_items.append(f"Quiz Questions ({quiz_count})")
-    if discussion_count > 0:
-        knowledge_items.append(f"Discussion Questions ({discussion_count})")
+        questions = idea.get("exampleQuestions") or ()
+        is_quiz = "quiz" in idea_type
+        if is_quiz:
+            quiz_count += sum(1 for q in questions if q.get("options"))
+        if "discussion" in idea_type:
+            discussion_slides += len(questions)
+            if not is_quiz:  # the agenda lists mixed ideas under quizzes only
+                discussion_count += len(questions)
+    knowledge_items = (quiz_count > 0) + (discussion_count > 0)
     if knowledge_items:
-        agenda_items.append({"title": "Test Your Knowledge", "items": knowledge_items})
-    if content.get("furtherReadings", []):
-        agenda_items.append(
-            {"title": "Additional Resources", "items": ["Further Readings & Resources"]}
+        agenda_sections += 1
+        agenda_items += knowledge_items
+    slides += quiz_count * 2
+    slides += discussion_slides * 2
+    readings_per_slide = 2
+    if readings:
+        agenda_sections += 1
+        agenda_items += 1
+        slides += -(-len(readings) // readings_per_slide)
+    if has_facilitation_notes:
+        slides += 1
+    return agenda_sections, agenda_items, slides
+
+
+def calculate_total_slides(content):
+    """Count the slides ``build_full_presentation`` will create for ``content``.
+
+    Not memoized: ``content`` is a mutable dict, and the builder calls this
+    once per build.
+    """
+    total = 0
+    total += 1  # Title
+    # Agenda slides: one row per section title plus one per item, counted
+    # while walking each collection. Introduction always lists learning
+    # outcomes and key terms.
+    agenda_sections = 1
+    agenda_items = 2
+    slides = content.get("slides") or ()
+    content_titles = 0
+    for slide_content in slides:
+        title = slide_content.get("title")
+        if title and clean_slide_title(title):
+            content_titles += 1
+    if content_titles:
+        agenda_sections += 1
+        agenda_items += content_titles
+    activities = content.get("activities") or ()
+    ideas = content.get("assessmentIdeas") or ()
+    readings = content.get("furtherReadings") or ()
+    extra_slides = 0
+    # Decks with only content slides skip the extras walk entirely
+    if activities or ideas or readings:
+        extra_sections, extra_items, extra_slides = _count_extras(
+            activities, ideas, readings
         )
-    section_height = 0.5
-    item_height = 0.35
-    total_height_needed = 0
-    for section in agenda_items:
-        total_height_needed += section_height
-        total_height_needed += len(section["items"]) * item_height
-    available_height = FOOTER_Y - 1.2
-    slides_needed = math.ceil(total_height_needed / available_height)
+        agenda_sections += extra_sections
+        agenda_items += extra_items
+    total_units = _SECTION_UNITS * agenda_sections + _ITEM_UNITS * agenda_items
+    slides_needed = -(-total_units // _AVAILABLE_UNITS)
     total += slides_needed
     total += 1  # Learning outcomes
-    key_terms = content.get("keyTerms", [])
+    key_terms = content.get("keyTerms") or ()
     key_terms_per_slide = 4
     if key_terms:
-        total += (len(key_terms) + key_terms_per_slide - 1) // key_terms_per_slide
-    total += len(content.get("slides", []))
-    total += len(content.get("activities", [])) * 2
-    for idea in content.get("assessmentIdeas", []):
-        if "quiz" in idea.get("type", "").lower():
-            total += (
-                len([q for q in idea.get("exampleQuestions", []) if q.get("options")])
-                * 2
-            )
-    for idea in content.get("assessmentIdeas", []):
-        if "discussion" in idea.get("type", "").lower():
-            total += (
-                len(
-                    idea.get("exampleQuestions", [])
-                    if idea.get("exampleQuestions")
-                    else []
-                )
-                * 2
-            )
-    readings = content.get("furtherReadings", [])
-    readings_per_slide = 2
-    if readings:
-        total += (len(readings) + readings_per_slide - 1) // readings_per_slide
+        total += -(-len(key_terms) // key_terms_per_slide)
+    total += len(slides)
+    total += extra_slides
     total += 1  # Closing
-    has_facilitation_notes = False
-    for activity in content.get("activities", []):
-        description = activity.get("description", "")
-        for pattern in [
-            "Facilitation notes:",
-            "Facilitation Notes:",
-            "Facilitator notes:",
-        ]:
-            if pattern in description:
-                has_facilitation_notes = True
-                break
-        if has_facilitation_notes:
-            break
-    if has_facilitation_notes:
-        total += 1
     return total
@@ -0,0 +1,42 @@
+from collections import namedtuple
+
+SlideOffsets = namedtuple(
+    "SlideOffsets",
+    [
+        "content_offset",
+        "base_offset",
+        "quiz_count",
+        "discussion_count",
+    ],
+)
+
+
+def compute_slide_offsets(content):
+    """Count the slides preceding each late section in a single pass.
+
+    ``content_offset`` precedes the content slides and ``base_offset`` the
+    quiz slides. ``quiz_count`` and ``discussion_count`` are question counts;
+    each question produces a question slide and an answer slide.
+    """
+    quiz_count = 0
+    discussion_count = 0
+    for idea in content.get("assessmentIdeas", []):
+        idea_type = idea.get("type", "").lower()
+        questions = idea.get("exampleQuestions") or []
+        if "quiz" in idea_type:
+            quiz_count += sum(1 for q in questions if q.get("options"))
+        if "discussion" in idea_type:
+            discussion_count += len(questions)
+    slides = content.get("slides", [])
+    # The second content slide is skipped by create_content_slides
+    filtered_slide_count = len(slides) - 1 if len(slides) > 1 else len(slides)
+    content_offset = 2 + len(content.get("keyTerms", [])) // 4
+    base_offset = (
+        content_offset + filtered_slide_count + len(content.get("activities", [])) * 2
+    )
+    return SlideOffsets(
+        content_offset,
+        base_offset,
+        quiz_count,
+        discussion_count,
+    )
@@ -1,4 +1,10 @@
-import math, re, json
+import re, json
+from functools import lru_cache
+
+try:
+    import numpy as np
+except ImportError:  # optional: batch height estimates fall back to a loop
+    np = None
 from .constants import (
     BULLET_MARKERS,
     SUB_BULLET_MARKERS,
@@ -7,45 +13,96 @@ from .constants import (
     AVAILABLE_CONTENT_HEIGHT,
 )
 
+_NUMBERED_RE = re.compile(r"^\d+\.\s")
 
-def clean_slide_title(title: str) -> str:
+
+def _alternation(patterns):
+    return re.compile("|".join(map(re.escape, patterns)))
+
+
+def _by_first_char(markers):
+    """Group markers by their first character, keeping list order."""
+    table = {}
+    for marker in markers:
+        table.setdefault(marker[0], []).append(marker)
+    return {char: tuple(group) for char, group in table.items()}
+
+
+# Bullet markers are looked up by the line's first character, so only the
+# markers that can match are tested
+_BULLETS_BY_FIRST = _by_first_char(BULLET_MARKERS)
+_SUB_BULLETS_BY_FIRST = _by_first_char(SUB_BULLET_MARKERS)
+
+# One compiled alternation per marker list: a single search finds the
+# marker instead of testing each one in turn.
+_FACILITATION_MARKERS = (
+    "Facilitation notes:",
+    "Facilitation Notes:",
+    "FACILITATION NOTES:",
+    "Facilitator notes:",
+    "Facilitator guidance:",
+    "Facilitation tip:",
+    "Catatan fasilitasi:",
+    "Catatan Fasilitasi:",
+    "Panduan Fasilitator:",
+)
+_LEARNING_MARKERS = (
+    "Learning Objective:",
+    "Learning Objectives:",
+    "LEARNING OBJECTIVES:",
+    "Success criteria:",
+    "Tujuan Pembelajaran:",
+    "Kriteria keberhasilan:",
+)
+_FACILITATION_RE = _alternation(_FACILITATION_MARKERS)
+_LEARNING_RE = _alternation(_LEARNING_MARKERS)
+# Most descriptions carry neither kind of marker; one scan rules both out
+_ANY_MARKER_RE = _alternation(_FACILITATION_MARKERS + _LEARNING_MARKERS)
+
+
+# "Slide 3 Intro" / "Activity 2 Group work": keyword, number, then the title
+_TITLE_PREFIX_RE = re.compile(
+    r"(slide|activity)\s+(\S+)(?:\s+(.*))?", re.IGNORECASE | re.DOTALL
+)
+
+
+def _clean_numbered_title(title: str, keyword: str) -> str:
     if ":" in title:
         return title.split(":", 1)[1].strip()
-    parts = title.split()
-    if (
-        len(parts) > 1
-        and parts[0].lower() == "slide"
-        and parts[1].replace(":", "").isdigit()
-    ):
-        return " ".join(parts[2:]).strip()
-    return title.strip()
+    title = title.strip()
+    m = _TITLE_PREFIX_RE.fullmatch(title)
+    if m and m.group(1).lower() == keyword and m.group(2).isdigit():
+        return " ".join((m.group(3) or "").split())
+    return title
 
 
+# Titles are cleaned again for the agenda, the slide count and each slide
+@lru_cache(maxsize=2048)
+def clean_slide_title(title: str) -> str:
+    return _clean_numbered_title(title, "slide")
+
+
+@lru_cache(maxsize=2048)
 def clean_activity_title(title: str) -> str:
-    if ":" in title:
-        return title.split(":", 1)[1].strip()
-    parts = title.split()
-    if (
-        len(parts) > 1
-        and parts[0].lower() == "activity"
-        and parts[1].replace(":", "").isdigit()
-    ):
-        return " ".join(parts[2:]).strip()
-    return title.strip()
+    return _clean_numbered_title(title, "activity")
+
+
+def as_text(value) -> str:
+    return value if isinstance(value, str) else json.dumps(value)
 
 
 def detect_bullet_level(text: str):
     text = text.strip()
-    for marker in BULLET_MARKERS:
+    for marker in _BULLETS_BY_FIRST.get(text[:1], ()):
         if text.startswith(marker):
             return True, 0, text[len(marker) :].strip()
-    if text.startswith("  ") or text.startswith("\t"):
+    if text.startswith(("  ", "\t")):
         stripped = text.lstrip()
-        for marker in SUB_BULLET_MARKERS:
+        for marker in _SUB_BULLETS_BY_FIRST.get(stripped[:1], ()):
             if stripped.startswith(marker):
                 return True, 1, stripped[len(marker) :].strip()
         return True, 1, stripped
-    if re.match(r"^\d+\.\s", text):
+    if _NUMBERED_RE.match(text):
         return False, 0, text
     return False, 0, text
 
@@ -59,52 +116,60 @@ def calculate_dynamic_spacing(
     return min(0.8, max(min_height, available_height / max(count, 1)))
 
 
-def estimate_text_height(text: str, font_size: int, width: float):
+def _line_metrics(font_size: int, width: float):
+    """Return ``(chars_per_line, line_height)`` for the height estimates."""
     chars_per_inch = 120 / (font_size / 10)
     chars_per_line = max(1, int(chars_per_inch * width))
-    lines = math.ceil(len(text) / chars_per_line)
     line_height = (font_size / 72) * 1.2
+    return chars_per_line, line_height
+
+
+def estimate_text_height(text: str, font_size: int, width: float):
+    return _estimate_text_height_core(len(text), font_size, width)
+
+
+# The estimate only depends on the text length, so cache on that instead of
+# the text itself to keep the cache small and shared across similar texts.
+@lru_cache(maxsize=2048)
+def _estimate_text_height_core(length: int, font_size: int, width: float):
+    chars_per_line, line_height = _line_metrics(font_size, width)
+    lines = -(-length // chars_per_line)
     return max(0.2, lines * line_height)
 
 
+def estimate_text_heights(texts, font_size: int, width: float):
+    """Estimate heights for a sequence of texts sharing one font and width.
+
+    Returns a list matching ``estimate_text_height`` for each text.
+    """
+    if np is None:
+        return [estimate_text_height(text, font_size, width) for text in texts]
+    chars_per_line, line_height = _line_metrics(font_size, width)
+    lengths = np.fromiter((len(text) for text in texts), dtype=np.int64)
+    lines = np.ceil(lengths / chars_per_line)
+    return np.maximum(0.2, lines * line_height).tolist()
+
+
 def check_content_overflow(y: float, h: float, footer=FOOTER_Y):
     return (y + h) > (footer - 0.2)
 
 
+# Each description is parsed for its activity slides and again for the
+# facilitation summary
+@lru_cache(maxsize=512)
 def extract_facilitation_content(text: str):
+    if _ANY_MARKER_RE.search(text) is None:
+        return text, "", ""
     clean_description = text
     facilitation_notes = ""
     learning_objectives = ""
-    facilitation_patterns = [
-        "Facilitation notes:",
-        "Facilitation Notes:",
-        "FACILITATION NOTES:",
-        "Facilitator notes:",
-        "Facilitator guidance:",
-        "Facilitation tip:",
-        "Catatan fasilitasi:",
-        "Catatan Fasilitasi:",
-        "Panduan Fasilitator:",
-    ]
-    for pattern in facilitation_patterns:
-        if pattern in text:
-            parts = text.split(pattern, 1)
-            clean_description = parts[0].strip()
-            facilitation_notes = parts[1].strip()
-            break
-    learning_patterns = [
-        "Learning Objective:",
-        "Learning Objectives:",
-        "LEARNING OBJECTIVES:",
-        "Success criteria:",
-        "Tujuan Pembelajaran:",
-        "Kriteria keberhasilan:",
-    ]
+    parts = _FACILITATION_RE.split(text, maxsplit=1)
+    if len(parts) == 2:
+        clean_description = parts[0].strip()
+        facilitation_notes = parts[1].strip()
     source = clean_description if facilitation_notes else text
-    for pattern in learning_patterns:
-        if pattern in source:
-            parts = source.split(pattern, 1)
-            clean_description = parts[0].strip()
-            learning_objectives = parts[1].strip()
-            break
+    parts = _LEARNING_RE.split(source, maxsplit=1)
+    if len(parts) == 2:
+        clean_description = parts[0].strip()
+        learning_objectives = parts[1].strip()
     return clean_description, facilitation_notes, learning_objectives
@@ -0,0 +1,43 @@
+import unittest
+
+from pptx.oxml.ns import qn
+
+from pptx_builder.builder import build_full_presentation
+from pptx_builder.sections.agenda import _ITEM_HEIGHT, _LIST_Y, _MAX_Y
+
+
+def _agenda_list_boxes(prs):
+    """Return the agenda list text box of each agenda slide."""
+    boxes = []
+    for slide in prs.slides:
+        for shape in slide.shapes:
+            if shape.has_text_frame and any(
+                p.text.startswith("• ") for p in shape.text_frame.paragraphs
+            ):
+                boxes.append(shape)
+                break
+    return boxes
+
+
+class AgendaLayoutTest(unittest.TestCase):
+    def test_long_item_stays_on_one_line(self):
+        # Far wider than the 8.5in list at 18pt
+        long_title = "Slide 1: " + "A very long outline item " * 20
+        content = {
+            "title": "Deck",
+            "slides": [{"title": long_title, "content": []}]
+            + [{"title": f"Slide {i}: Topic {i}", "content": []} for i in range(2, 6)],
+        }
+        prs = build_full_presentation(content)
+        boxes = _agenda_list_boxes(prs)
+        self.assertEqual(len(boxes), 1)
+        box = boxes[0]
+        body_pr = box.text_frame._txBody.find(qn("a:bodyPr"))
+        self.assertEqual(body_pr.get("wrap"), "none")
+        # Every row still occupies one fixed-height line inside the list area
+        rows = len(box.text_frame.paragraphs)
+        self.assertLessEqual(_LIST_Y + rows * _ITEM_HEIGHT, _MAX_Y)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,25 @@
+import unittest
+
+from pptx_builder.sections.content import _MODERN_BULLETS, _classify_points
+
+
+class ClassifyPointsTest(unittest.TestCase):
+    def test_non_string_point_is_not_a_sub_point(self):
+        # json.dumps(-5) starts with "-", but only string points decide
+        # whether the slide has sub-points
+        rows = _classify_points([-5, "plain"])
+        level, _, bold, text = rows[1]
+        self.assertEqual(level, 0)
+        self.assertFalse(bold)
+        self.assertEqual(text, "• plain" if _MODERN_BULLETS else "plain")
+
+    def test_string_sub_point_keeps_plain_lines_unbulleted(self):
+        rows = _classify_points(["- sub", "plain"])
+        level, _, bold, text = rows[1]
+        self.assertEqual(level, 0)
+        self.assertTrue(bold)
+        self.assertEqual(text, "plain")
+
+
+if __name__ == "__main__":
+    unittest.main()